@@ -9,16 +9,218 @@ Builds structured responses that guide the Agent through RCA process:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from random import choice
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from rootcause_mcp.application.session_progress import SessionProgress
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
 
-@dataclass
+# Stage → (required, tool, push question category, hint template).
+# The stage is resolved once by GuidedResponseBuilder._determine_stage, so
+# suggesting the next action is a single table lookup.
+_STAGE_DISPATCH: dict[str, tuple[bool, str, str, str]] = {
+    # Stage 1: Fishbone not started
+    "INIT": (
+        True,
+        "rc_start_session",
+        "session_missing",
+        "使用 rc_start_session 工具開始新的 RCA 分析",
+    ),
+    # Stage 2: Fishbone incomplete (fewer than 2 categories filled)
+    "GATHER_EARLY": (
+        True,
+        "rc_add_cause",
+        "fishbone_empty",
+        "還有 {unfilled} 個類別未填寫，建議至少完成 4 個類別",
+    ),
+    # Stage 2: Fishbone incomplete (2-3 categories filled)
+    "GATHER_LATE": (
+        True,
+        "rc_add_cause",
+        "fishbone_partial",
+        "還有 {unfilled} 個類別未填寫，建議至少完成 4 個類別",
+    ),
+    # Stage 3: Why Tree not started
+    "ANALYZE_FISHBONE": (
+        True,
+        "rc_ask_why",
+        "why_not_started",
+        "選擇一個原因作為起點，開始 5-Why 分析",
+    ),
+    # Stage 4: Why Tree too shallow
+    "WHY_ANALYSIS": (
+        True,
+        "rc_ask_why",
+        "why_shallow",
+        "目前 Why 深度為 {depth}，建議追問到至少 3 層",
+    ),
+    # Stage 5: No root cause identified
+    "IDENTIFY_ROOT": (
+        True,
+        "rc_mark_root_cause",
+        "why_deep",
+        "如果已找到根本原因，請標記它",
+    ),
+    # Stage 6: Root cause not verified (optional but recommended)
+    "VERIFY": (
+        False,
+        "rc_verify_causation",
+        "verification_needed",
+        "建議驗證因果關係的強度",
+    ),
+    # Stage 7: Analysis complete
+    "COMPLETE": (
+        False,
+        "rc_get_why_tree",
+        "analysis_complete",
+        "可以匯出報告或繼續深入分析其他分支",
+    ),
+}
+
+# Stage gates in analysis order: (stage, SessionProgress attribute, minimum
+# value). The first gate whose minimum is not met is the current stage;
+# passing every gate means the analysis is COMPLETE.
+_STAGE_GATES: tuple[tuple[str, str, int], ...] = (
+    ("INIT", "fishbone_initialized", 1),
+    ("GATHER_EARLY", "fishbone_categories_filled", 2),
+    ("GATHER_LATE", "fishbone_categories_filled", 4),
+    ("ANALYZE_FISHBONE", "why_tree_started", 1),
+    ("WHY_ANALYSIS", "why_tree_depth", 3),
+    ("IDENTIFY_ROOT", "root_causes_identified", 1),
+    ("VERIFY", "root_causes_verified", 1),
+)
+
+# Stages whose hint needs progress values formatted in
+_TEMPLATED_STAGES = frozenset(
+    stage for stage, (_, _, _, hint) in _STAGE_DISPATCH.items() if "{" in hint
+)
+
+# Tool categories for next action suggestions (rc_* naming)
+FISHBONE_TOOLS = frozenset({
+    "rc_init_fishbone",
+    "rc_add_cause",
+    "rc_get_fishbone",
+    "rc_export_fishbone",
+})
+
+WHY_TREE_TOOLS = frozenset({
+    "rc_ask_why",
+    "rc_get_why_tree",
+    "rc_mark_root_cause",
+    "rc_export_why_tree",
+})
+
+VERIFICATION_TOOLS = frozenset({
+    "rc_verify_causation",
+})
+
+# Push questions for each stage (逼問)
+PUSH_QUESTIONS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "session_missing": (
+        "請先建立分析 Session，並描述要分析的問題是什麼？",
+    ),
+    "fishbone_empty": (
+        "這個問題發生時，現場的人員狀況如何？(Man)",
+        "使用的設備、儀器有什麼異常嗎？(Machine)", 
+        "操作方法或流程有哪些步驟可能出錯？(Method)",
+        "使用的材料、藥品有什麼問題嗎？(Material)",
+        "測量或監控有什麼遺漏嗎？(Measurement)",
+        "環境因素（溫度、照明、噪音）有影響嗎？(Environment)",
+    ),
+    "fishbone_partial": (
+        "還有哪些類別沒有考慮到？",
+        "目前列出的原因中，哪個最可疑？",
+        "有沒有多個原因互相影響的情況？",
+    ),
+    "why_not_started": (
+        "從魚骨圖中最可疑的原因開始，問「為什麼會發生？」",
+    ),
+    "why_shallow": (
+        "為什麼會發生這個情況？",
+        "這個原因背後還有什麼更深的原因嗎？",
+        "如果這個問題被解決了，同樣的事件還會再發生嗎？",
+        "還能再追問一個「為什麼」嗎？",
+    ),
+    "why_deep": (
+        "這是最根本的原因嗎？還是只是表象？",
+        "如果解決這個原因，問題真的不會再發生嗎？",
+        "有沒有系統性的問題被忽略了？",
+    ),
+    "root_cause_found": (
+        "這個根本原因符合 HFACS 的哪個分類？",
+        "需要驗證這個因果關係的強度嗎？",
+        "有沒有其他的根本原因也需要標記？",
+    ),
+    "verification_needed": (
+        "這個因果關係的 temporality (時間順序) 是否明確？",
+        "有沒有其他可能的解釋 (alternative explanation)？",
+        "證據的強度足夠嗎？",
+    ),
+    "analysis_complete": (
+        "分析已達到基本完成標準，是否需要檢視完整摘要？",
+    ),
+})
+
+# Completed-step checks: (SessionProgress attribute, minimum value)
+_STEP_THRESHOLDS: tuple[tuple[str, int], ...] = (
+    ("fishbone_initialized", 1),
+    ("fishbone_categories_filled", 3),
+    ("fishbone_categories_filled", 5),
+    ("why_tree_started", 1),
+    ("why_tree_depth", 2),
+    ("why_tree_depth", 4),
+    ("root_causes_identified", 1),
+    ("root_causes_verified", 1),
+    ("causes_with_hfacs", 1),
+    ("is_complete", 1),
+)
+
+# All 101 possible completion percentages ("0%" .. "100%")
+_PCT_STRINGS: tuple[str, ...] = tuple(f"{pct}%" for pct in range(101))
+
+# All 11 possible progress bars, indexed by filled tenths
+_PROGRESS_BARS: tuple[str, ...] = tuple(
+    "█" * filled + "░" * (10 - filled) for filled in range(11)
+)
+
+# Layout of the guidance appended by format_guided_response
+_TEMPLATE_PROGRESS = (
+    "{original}\n"
+    "\n"
+    "---\n"
+    "\n"
+    "## 📊 分析進度 [{bar}] {pct}%\n"
+    "\n"
+    "{criteria}\n"
+    "\n"
+)
+_TEMPLATE_INCOMPLETE = _TEMPLATE_PROGRESS + (
+    "## 🎯 下一步 {mark}\n"
+    "\n"
+    "**工具:** `{tool}`\n"
+    "**逼問:** {question}\n"
+    "**提示:** {hint}"
+)
+_TEMPLATE_COMPLETE = _TEMPLATE_PROGRESS + (
+    "## ✅ 分析已完成基本標準\n"
+    "\n"
+    "可以使用 `rc_export_fishbone` 或 `rc_export_why_tree` 匯出報告\n"
+    "或繼續深入分析其他分支"
+)
+
+
+@dataclass(slots=True)
 class NextAction:
     """Describes the next recommended action."""
     
+    # Field names, filled in once after the class is created
+    _FIELD_NAMES: ClassVar[tuple[str, ...]] = ()
+    
     required: bool = False
     tool: str = ""
     question: str = ""  # 逼問 - push question to deepen analysis
@@ -26,18 +228,19 @@ class NextAction:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "required": self.required,
-            "tool": self.tool,
-            "question": self.question,
-            "hint": self.hint,
-        }
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
 
 
-@dataclass 
+NextAction._FIELD_NAMES = tuple(f.name for f in fields(NextAction))
+
+
+@dataclass(slots=True)
 class GuidedResponse:
     """Structured response with guidance for the Agent."""
     
+    # Field names, filled in once after the class is created
+    _FIELD_NAMES: ClassVar[tuple[str, ...]] = ()
+    
     # Original result
     result: dict[str, Any] = field(default_factory=dict)
     
@@ -50,20 +253,29 @@ class GuidedResponse:
     # Next recommended action
     next_action: NextAction = field(default_factory=NextAction)
     
-    # Completion status
+    # Completion status (criteria list is shared with the text rendering,
+    # not copied; treat it as read-only)
     is_complete: bool = False
     completion_criteria: list[str] = field(default_factory=list)
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "result": self.result,
-            "session_progress": self.session_progress,
-            "current_state": self.current_state,
-            "next_action": self.next_action.to_dict(),
-            "is_complete": self.is_complete,
-            "completion_criteria": self.completion_criteria,
-        }
+        data = {name: getattr(self, name) for name in self._FIELD_NAMES}
+        data["next_action"] = self.next_action.to_dict()
+        return data
+
+
+GuidedResponse._FIELD_NAMES = tuple(f.name for f in fields(GuidedResponse))
+
+
+def _copy_state(state: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached state dict (one level of nested sections)."""
+    return {section: dict(values) for section, values in state.items()}
+
+
+def _completion_pct(progress: SessionProgress) -> int:
+    """Completion rate as a whole percentage clamped to 0-100."""
+    return max(0, min(100, round(progress.completion_rate * 100)))
 
 
 class GuidedResponseBuilder:
@@ -78,71 +290,33 @@ class GuidedResponseBuilder:
     """
     
     # Tool categories for next action suggestions (rc_* naming)
-    FISHBONE_TOOLS = {
-        "rc_init_fishbone",
-        "rc_add_cause",
-        "rc_get_fishbone",
-        "rc_export_fishbone",
-    }
+    FISHBONE_TOOLS = FISHBONE_TOOLS
+    WHY_TREE_TOOLS = WHY_TREE_TOOLS
+    VERIFICATION_TOOLS = VERIFICATION_TOOLS
     
-    WHY_TREE_TOOLS = {
-        "rc_ask_why",
-        "rc_get_why_tree",
-        "rc_mark_root_cause",
-        "rc_export_why_tree",
-    }
+    # Push questions for each stage (逼問)
+    PUSH_QUESTIONS = PUSH_QUESTIONS
     
-    VERIFICATION_TOOLS = {
-        "rc_verify_causation",
-    }
+    _DEFAULT_QUESTIONS: tuple[str, ...] = ("請繼續分析",)
     
-    # Push questions for each stage (逼問)
-    PUSH_QUESTIONS = {
-        "fishbone_empty": [
-            "這個問題發生時，現場的人員狀況如何？(Man)",
-            "使用的設備、儀器有什麼異常嗎？(Machine)", 
-            "操作方法或流程有哪些步驟可能出錯？(Method)",
-            "使用的材料、藥品有什麼問題嗎？(Material)",
-            "測量或監控有什麼遺漏嗎？(Measurement)",
-            "環境因素（溫度、照明、噪音）有影響嗎？(Environment)",
-        ],
-        "fishbone_partial": [
-            "還有哪些類別沒有考慮到？",
-            "目前列出的原因中，哪個最可疑？",
-            "有沒有多個原因互相影響的情況？",
-        ],
-        "why_shallow": [
-            "為什麼會發生這個情況？",
-            "這個原因背後還有什麼更深的原因嗎？",
-            "如果這個問題被解決了，同樣的事件還會再發生嗎？",
-            "還能再追問一個「為什麼」嗎？",
-        ],
-        "why_deep": [
-            "這是最根本的原因嗎？還是只是表象？",
-            "如果解決這個原因，問題真的不會再發生嗎？",
-            "有沒有系統性的問題被忽略了？",
-        ],
-        "root_cause_found": [
-            "這個根本原因符合 HFACS 的哪個分類？",
-            "需要驗證這個因果關係的強度嗎？",
-            "有沒有其他的根本原因也需要標記？",
-        ],
-        "verification_needed": [
-            "這個因果關係的 temporality (時間順序) 是否明確？",
-            "有沒有其他可能的解釋 (alternative explanation)？",
-            "證據的強度足夠嗎？",
-        ],
-    }
+    # Max cached progress/state dicts per builder
+    _CACHE_SIZE = 128
     
     def __init__(self) -> None:
         """Initialize builder."""
-        pass
+        # (session_id, progress version) -> dict; callers get copies
+        self._progress_cache: OrderedDict[tuple[str, int], dict[str, Any]] = (
+            OrderedDict()
+        )
+        self._state_cache: OrderedDict[tuple[str, int], dict[str, Any]] = (
+            OrderedDict()
+        )
     
     def build(
         self,
         result: dict[str, Any],
         progress: SessionProgress,
-        tool_name: str,
+        tool_name: str,  # noqa: ARG002
     ) -> GuidedResponse:
         """
         Build a guided response.
@@ -155,32 +329,126 @@ class GuidedResponseBuilder:
         Returns:
             GuidedResponse with progress and next action
         """
-        response = GuidedResponse(
+        stage = self._determine_stage(progress)
+        return self._build_response(
+            result,
+            progress,
+            stage,
+            _completion_pct(progress),
+            # Determine next action based on current state
+            self._suggest_next_action(stage, progress),
+        )
+    
+    def format_text(self, original_text: str, progress: SessionProgress) -> str:
+        """
+        Format a tool response text with progress and next action guidance.
+        
+        Args:
+            original_text: The original tool response text
+            progress: Current session progress
+            
+        Returns:
+            Enhanced text with progress and guidance
+        """
+        criteria = progress.completion_criteria
+        if progress.is_complete:
+            return _render_text(original_text, criteria, _completion_pct(progress))
+        next_action = self._suggest_next_action(
+            self._determine_stage(progress), progress
+        )
+        return _render_text(
+            original_text, criteria, _completion_pct(progress), next_action
+        )
+    
+    def build_and_format(
+        self,
+        result: dict[str, Any],
+        original_text: str,
+        progress: SessionProgress,
+        tool_name: str,  # noqa: ARG002
+    ) -> tuple[GuidedResponse, str]:
+        """
+        Build a guided response and its formatted text in one pass.
+        
+        Stage, completion percentage and next action are computed once
+        and shared by both outputs.
+        
+        Args:
+            result: The original tool result
+            original_text: The original tool response text
+            progress: Current session progress
+            tool_name: The tool that was just called
+            
+        Returns:
+            Tuple of (GuidedResponse, formatted text)
+        """
+        stage = self._determine_stage(progress)
+        completion_pct = _completion_pct(progress)
+        next_action = self._suggest_next_action(stage, progress)
+        response = self._build_response(
+            result, progress, stage, completion_pct, next_action
+        )
+        # Render from the response's criteria rather than recomputing them
+        text = _render_text(
+            original_text,
+            response.completion_criteria,
+            completion_pct,
+            None if response.is_complete else next_action,
+        )
+        return response, text
+    
+    def _build_response(
+        self,
+        result: dict[str, Any],
+        progress: SessionProgress,
+        stage: str,
+        completion_pct: int,
+        next_action: NextAction,
+    ) -> GuidedResponse:
+        """Assemble a GuidedResponse from precomputed parts."""
+        return GuidedResponse(
             result=result,
-            session_progress=self._build_progress_dict(progress),
+            session_progress=self._build_progress_dict(
+                progress, stage, completion_pct
+            ),
             current_state=self._build_state_dict(progress),
+            next_action=next_action,
             is_complete=progress.is_complete,
             completion_criteria=progress.completion_criteria,
         )
-        
-        # Determine next action based on current state
-        response.next_action = self._suggest_next_action(progress, tool_name)
-        
-        return response
     
-    def _build_progress_dict(self, progress: SessionProgress) -> dict[str, Any]:
-        """Build progress summary dictionary."""
-        return {
+    def _build_progress_dict(
+        self,
+        progress: SessionProgress,
+        stage: str,
+        completion_pct: int,
+    ) -> dict[str, Any]:
+        """Build progress summary dictionary (cached per progress version)."""
+        key = (progress.session_id, progress.version)
+        cached = self._progress_cache.get(key)
+        if cached is not None:
+            self._progress_cache.move_to_end(key)
+            return dict(cached)
+        
+        data = {
             "session_id": progress.session_id,
-            "current_stage": self._determine_stage(progress),
+            "current_stage": stage,
             "completed_steps": self._count_completed_steps(progress),
             "total_expected": 10,  # Approximate total steps
-            "completion_rate": f"{progress.completion_rate * 100:.0f}%",
+            "completion_rate": _PCT_STRINGS[completion_pct],
         }
+        self._remember(self._progress_cache, key, data)
+        return dict(data)
     
     def _build_state_dict(self, progress: SessionProgress) -> dict[str, Any]:
-        """Build current state summary dictionary."""
-        return {
+        """Build current state summary dictionary (cached per progress version)."""
+        key = (progress.session_id, progress.version)
+        cached = self._state_cache.get(key)
+        if cached is not None:
+            self._state_cache.move_to_end(key)
+            return _copy_state(cached)
+        
+        data = {
             "fishbone": {
                 "initialized": progress.fishbone_initialized,
                 "categories_filled": f"{progress.fishbone_categories_filled}/6",
@@ -199,139 +467,72 @@ class GuidedResponseBuilder:
                 "causes_tagged": progress.causes_with_hfacs,
             },
         }
+        self._remember(self._state_cache, key, data)
+        return _copy_state(data)
+    
+    def _remember(
+        self,
+        cache: OrderedDict[tuple[str, int], dict[str, Any]],
+        key: tuple[str, int],
+        data: dict[str, Any],
+    ) -> None:
+        """Store a built dict, evicting the least recently used entry."""
+        cache[key] = data
+        if len(cache) > self._CACHE_SIZE:
+            cache.popitem(last=False)
     
     def _determine_stage(self, progress: SessionProgress) -> str:
         """Determine current analysis stage."""
-        if not progress.fishbone_initialized:
-            return "INIT"
-        elif progress.fishbone_categories_filled < 3:
-            return "GATHER"
-        elif not progress.why_tree_started:
-            return "ANALYZE_FISHBONE"
-        elif progress.why_tree_depth < 3:
-            return "WHY_ANALYSIS"
-        elif progress.root_causes_identified == 0:
-            return "IDENTIFY_ROOT"
-        elif progress.root_causes_verified == 0:
-            return "VERIFY"
-        else:
-            return "COMPLETE"
+        return next(
+            (
+                stage
+                for stage, name, minimum in _STAGE_GATES
+                if getattr(progress, name) < minimum
+            ),
+            "COMPLETE",
+        )
     
     def _count_completed_steps(self, progress: SessionProgress) -> int:
         """Count completed analysis steps."""
-        steps = 0
-        
-        if progress.fishbone_initialized:
-            steps += 1
-        if progress.fishbone_categories_filled >= 3:
-            steps += 1
-        if progress.fishbone_categories_filled >= 5:
-            steps += 1
-        if progress.why_tree_started:
-            steps += 1
-        if progress.why_tree_depth >= 2:
-            steps += 1
-        if progress.why_tree_depth >= 4:
-            steps += 1
-        if progress.root_causes_identified > 0:
-            steps += 1
-        if progress.root_causes_verified > 0:
-            steps += 1
-        if progress.causes_with_hfacs > 0:
-            steps += 1
-        if progress.is_complete:
-            steps += 1
-        
-        return steps
+        return sum(
+            getattr(progress, name) >= threshold
+            for name, threshold in _STEP_THRESHOLDS
+        )
     
     def _suggest_next_action(
         self,
+        stage: str,
         progress: SessionProgress,
-        tool_name: str,
     ) -> NextAction:
-        """Suggest the next action based on current progress."""
-        
-        # Stage 1: Fishbone not started
-        if not progress.fishbone_initialized:
-            return NextAction(
-                required=True,
-                tool="rc_start_session",
-                question="請先建立分析 Session，並描述要分析的問題是什麼？",
-                hint="使用 rc_start_session 工具開始新的 RCA 分析",
-            )
-        
-        # Stage 2: Fishbone incomplete
-        if progress.fishbone_categories_filled < 4:
-            # Suggest filling more categories
-            unfilled = 6 - progress.fishbone_categories_filled
-            push_q = self._get_push_question(
-                "fishbone_empty" if progress.fishbone_categories_filled < 2 else "fishbone_partial"
-            )
-            return NextAction(
-                required=True,
-                tool="rc_add_cause",
-                question=push_q,
-                hint=f"還有 {unfilled} 個類別未填寫，建議至少完成 4 個類別",
-            )
-        
-        # Stage 3: Why Tree not started
-        if not progress.why_tree_started:
-            return NextAction(
-                required=True,
-                tool="rc_ask_why",
-                question="從魚骨圖中最可疑的原因開始，問「為什麼會發生？」",
-                hint="選擇一個原因作為起點，開始 5-Why 分析",
-            )
-        
-        # Stage 4: Why Tree too shallow
-        if progress.why_tree_depth < 3:
-            push_q = self._get_push_question("why_shallow")
-            return NextAction(
-                required=True,
-                tool="rc_ask_why",
-                question=push_q,
-                hint=f"目前 Why 深度為 {progress.why_tree_depth}，建議追問到至少 3 層",
-            )
-        
-        # Stage 5: No root cause identified
-        if progress.root_causes_identified == 0:
-            push_q = self._get_push_question("why_deep")
-            return NextAction(
-                required=True,
-                tool="rc_mark_root_cause",
-                question=push_q,
-                hint="如果已找到根本原因，請標記它",
-            )
-        
-        # Stage 6: Root cause not verified
-        if progress.root_causes_verified == 0:
-            push_q = self._get_push_question("verification_needed")
-            return NextAction(
-                required=False,  # Optional but recommended
-                tool="rc_verify_causation",
-                question=push_q,
-                hint="建議驗證因果關係的強度",
+        """Suggest the next action for an already-determined stage."""
+        required, tool, category, hint = _STAGE_DISPATCH[stage]
+
+        if stage in _TEMPLATED_STAGES:
+            hint = hint.format(
+                unfilled=6 - progress.fishbone_categories_filled,
+                depth=progress.why_tree_depth,
             )
-        
-        # Stage 7: Analysis complete
+
         return NextAction(
-            required=False,
-            tool="rc_get_why_tree",
-            question="分析已達到基本完成標準，是否需要檢視完整摘要？",
-            hint="可以匯出報告或繼續深入分析其他分支",
+            required=required,
+            tool=tool,
+            question=self._get_push_question(category),
+            hint=hint,
         )
     
     def _get_push_question(self, category: str) -> str:
         """Get a push question from the category."""
-        import random
-        questions = self.PUSH_QUESTIONS.get(category, ["請繼續分析"])
-        return random.choice(questions)
+        return choice(self.PUSH_QUESTIONS.get(category, self._DEFAULT_QUESTIONS))
+
+
+# Shared builder used by format_guided_response
+_DEFAULT_BUILDER = GuidedResponseBuilder()
 
 
 def format_guided_response(
     original_text: str,
     progress: SessionProgress,
-    tool_name: str,
+    tool_name: str,  # noqa: ARG001
 ) -> str:
     """
     Format a tool response with progress tracking and next action guidance.
@@ -349,46 +550,37 @@ def format_guided_response(
     Returns:
         Enhanced text with progress and guidance
     """
-    builder = GuidedResponseBuilder()
-    next_action = builder._suggest_next_action(progress, tool_name)
-    
-    # Build progress bar
-    completion_pct = int(progress.completion_rate * 100)
-    filled = completion_pct // 10
-    bar = "█" * filled + "░" * (10 - filled)
-    
-    # Build the enhanced response
-    sections = [
-        original_text,
-        "",
-        "---",
-        "",
-        f"## 📊 分析進度 [{bar}] {completion_pct}%",
-        "",
-    ]
-    
-    # Add completion criteria
-    for criterion in progress.completion_criteria:
-        sections.append(f"- {criterion}")
+    return _DEFAULT_BUILDER.format_text(original_text, progress)
+
+
+def _render_text(
+    original_text: str,
+    completion_criteria: Sequence[str],
+    completion_pct: int,
+    next_action: NextAction | None = None,
+) -> str:
+    """Fill the guidance template; next_action is omitted once complete."""
+    bar = _PROGRESS_BARS[completion_pct // 10]
+    criteria = "\n".join(
+        f"- {criterion}" for criterion in completion_criteria
+    )
     
-    sections.append("")
+    if next_action is None:
+        return _TEMPLATE_COMPLETE.format(
+            original=original_text,
+            bar=bar,
+            pct=completion_pct,
+            criteria=criteria,
+        )
     
     # Add next action suggestion (逼問)
-    if not progress.is_complete:
-        required_mark = "⚠️ **必要**" if next_action.required else "💡 建議"
-        sections.extend([
-            f"## 🎯 下一步 {required_mark}",
-            "",
-            f"**工具:** `{next_action.tool}`",
-            f"**逼問:** {next_action.question}",
-            f"**提示:** {next_action.hint}",
-        ])
-    else:
-        sections.extend([
-            "## ✅ 分析已完成基本標準",
-            "",
-            "可以使用 `rc_export_fishbone` 或 `rc_export_why_tree` 匯出報告",
-            "或繼續深入分析其他分支",
-        ])
-    
-    return "\n".join(sections)
\ No newline at end of file
+    return _TEMPLATE_INCOMPLETE.format(
+        original=original_text,
+        bar=bar,
+        pct=completion_pct,
+        criteria=criteria,
+        mark="⚠️ **必要**" if next_action.required else "💡 建議",
+        tool=next_action.tool,
+        question=next_action.question,
+        hint=next_action.hint,
+    )
@@ -10,18 +10,45 @@ Tracks RCA session progress across all tools:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+from itertools import count
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from rootcause_mcp.domain.entities.fishbone import Fishbone
     from rootcause_mcp.domain.entities.why_node import WhyChain
 
-
-@dataclass
+# Completion criteria text, indexed by whether the criterion is met
+_FISHBONE_CRITERION = (
+    "❌ Fishbone: 至少填寫 4/6 類別 (目前: {n})",
+    "✅ Fishbone: {n}/6 類別已填寫",
+)
+_WHY_CRITERION = (
+    "❌ Why 分析: 深度不足 (目前: {n}, 建議 ≥3)",
+    "✅ Why 分析: 深度 {n} (建議 ≥3)",
+)
+_ROOT_CAUSE_CRITERION = (
+    "❌ 尚未標記任何根本原因",
+    "✅ 已標記 {n} 個根本原因",
+)
+_VERIFIED_CRITERION = "✅ 已驗證 {n} 個因果關係"
+_UNVERIFIED_CRITERION = "⚠️ 建議驗證已識別的根本原因"
+
+# Global source of SessionProgress versions, so a version is never reused
+# even when a session's progress is cleared and recreated
+_VERSIONS = count(1)
+
+# Marks a field not yet assigned (during __init__)
+_UNSET = object()
+
+
+@dataclass(slots=True)
 class SessionProgress:
     """Current progress state of an RCA session."""
 
+    # Serialized field names, filled in once after the class is created
+    FIELDS: ClassVar[tuple[str, ...]] = ()
+
     # Session info
     session_id: str
     current_stage: str = "GATHER"
@@ -45,57 +72,57 @@ class SessionProgress:
     # HFACS progress
     causes_with_hfacs: int = 0
 
+    # Bumped whenever a field changes; lets callers memoize derived views
+    version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set a field, moving to a fresh version if its value changed."""
+        if getattr(self, name, _UNSET) == value:
+            return
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "version", next(_VERSIONS))
+
     @property
     def completion_rate(self) -> float:
         """Calculate overall completion rate (0.0 - 1.0)."""
-        scores = []
+        total = 0.0
 
         # Fishbone score (weight: 30%)
         if self.fishbone_total_categories > 0:
-            fb_score = self.fishbone_categories_filled / self.fishbone_total_categories
-            scores.append(fb_score * 0.3)
+            total += (
+                self.fishbone_categories_filled / self.fishbone_total_categories
+            ) * 0.3
 
         # Why Tree score (weight: 40%)
         if self.why_tree_started:
             # At least 3 levels for meaningful analysis
-            why_score = min(self.why_tree_depth / 3.0, 1.0)
-            scores.append(why_score * 0.4)
+            total += min(self.why_tree_depth / 3.0, 1.0) * 0.4
 
         # Root cause score (weight: 30%)
         if self.root_causes_identified > 0:
-            rc_score = 1.0 if self.root_causes_verified > 0 else 0.5
-            scores.append(rc_score * 0.3)
+            total += (1.0 if self.root_causes_verified > 0 else 0.5) * 0.3
 
-        return sum(scores) if scores else 0.0
+        return total
 
     @property
     def completion_criteria(self) -> list[str]:
         """Get list of completion criteria with status."""
-        criteria = []
-
-        # Fishbone criteria
-        if self.fishbone_categories_filled >= 4:
-            criteria.append(f"✅ Fishbone: {self.fishbone_categories_filled}/6 類別已填寫")
-        else:
-            criteria.append(f"❌ Fishbone: 至少填寫 4/6 類別 (目前: {self.fishbone_categories_filled})")
-
-        # Why Tree criteria
-        if self.why_tree_depth >= 3:
-            criteria.append(f"✅ Why 分析: 深度 {self.why_tree_depth} (建議 ≥3)")
-        else:
-            criteria.append(f"❌ Why 分析: 深度不足 (目前: {self.why_tree_depth}, 建議 ≥3)")
-
-        # Root cause criteria
-        if self.root_causes_identified > 0:
-            criteria.append(f"✅ 已標記 {self.root_causes_identified} 個根本原因")
-        else:
-            criteria.append("❌ 尚未標記任何根本原因")
-
-        # Verification criteria
+        filled = self.fishbone_categories_filled
+        depth = self.why_tree_depth
+        identified = self.root_causes_identified
+        criteria = [
+            _FISHBONE_CRITERION[filled >= 4].format(n=filled),
+            _WHY_CRITERION[depth >= 3].format(n=depth),
+            _ROOT_CAUSE_CRITERION[identified > 0].format(n=identified),
+        ]
+
+        # Verification criteria (only shown once verified or identified)
         if self.root_causes_verified > 0:
-            criteria.append(f"✅ 已驗證 {self.root_causes_verified} 個因果關係")
-        elif self.root_causes_identified > 0:
-            criteria.append("⚠️ 建議驗證已識別的根本原因")
+            criteria.append(
+                _VERIFIED_CRITERION.format(n=self.root_causes_verified)
+            )
+        elif identified > 0:
+            criteria.append(_UNVERIFIED_CRITERION)
 
         return criteria
 
@@ -108,6 +135,14 @@ class SessionProgress:
             and self.root_causes_identified > 0
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert progress fields to dictionary."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+# The internal version counter is not part of the serialized progress
+SessionProgress.FIELDS = tuple(f.name for f in fields(SessionProgress) if f.init)
+
 
 class SessionProgressTracker:
     """
@@ -125,9 +160,11 @@ class SessionProgressTracker:
 
     def get_progress(self, session_id: str) -> SessionProgress:
         """Get or create progress for a session."""
-        if session_id not in self._progress_cache:
-            self._progress_cache[session_id] = SessionProgress(session_id=session_id)
-        return self._progress_cache[session_id]
+        progress = self._progress_cache.get(session_id)
+        if progress is None:
+            progress = SessionProgress(session_id=session_id)
+            self._progress_cache[session_id] = progress
+        return progress
 
     def update_from_fishbone(
         self,
@@ -146,11 +183,11 @@ class SessionProgressTracker:
         # Count filled categories
         filled = 0
         total_causes = 0
-        for category in fishbone.categories:
-            cat = fishbone.categories[category]
-            if cat.has_causes:
+        for category in fishbone.categories.values():
+            cause_count = len(category.causes)
+            if cause_count:
                 filled += 1
-                total_causes += cat.cause_count
+                total_causes += cause_count
 
         progress.fishbone_categories_filled = filled
         progress.fishbone_total_causes = total_causes
@@ -172,25 +209,31 @@ class SessionProgressTracker:
         progress.why_tree_started = True
         progress.why_tree_depth = why_chain.depth
         progress.why_tree_branches = len(why_chain.nodes)
-
-        # Count root causes
-        root_causes = sum(1 for node in why_chain.nodes if node.is_root_cause)
-        progress.root_causes_identified = root_causes
+        progress.root_causes_identified = why_chain.root_cause_count
 
         return progress
 
-    def update_root_cause_verified(self, session_id: str) -> SessionProgress:
-        """Mark that a root cause has been verified."""
+    def update_root_cause_verified(
+        self, session_id: str, count: int = 1
+    ) -> SessionProgress:
+        """Mark that root cause(s) have been verified."""
         progress = self.get_progress(session_id)
-        progress.root_causes_verified += 1
+        progress.root_causes_verified += count
         return progress
 
-    def update_hfacs_added(self, session_id: str) -> SessionProgress:
-        """Mark that HFACS code was added to a cause."""
+    def update_hfacs_added(self, session_id: str, count: int = 1) -> SessionProgress:
+        """Mark that HFACS code(s) were added to causes."""
         progress = self.get_progress(session_id)
-        progress.causes_with_hfacs += 1
+        progress.causes_with_hfacs += count
         return progress
 
+    def completion_rates(self) -> dict[str, float]:
+        """Get completion rate of every tracked session."""
+        return {
+            session_id: progress.completion_rate
+            for session_id, progress in self._progress_cache.items()
+        }
+
     def clear(self, session_id: str) -> None:
         """Clear progress cache for a session."""
         self._progress_cache.pop(session_id, None)
@@ -15,8 +15,15 @@ from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
 from rootcause_mcp.domain.value_objects.hfacs import HFACSCode, is_valid_hfacs_code
 
+_UTC = timezone.utc
 
-@dataclass
+
+def _utc_now() -> datetime:
+    """Current time in UTC (dataclass default factory)."""
+    return datetime.now(_UTC)
+
+
+@dataclass(slots=True)
 class Cause:
     """
     Cause Entity.
@@ -47,11 +54,17 @@ class Cause:
     depth: int = 1  # Depth from problem statement (1-5)
 
     # Metadata
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utc_now)
+    updated_at: datetime = field(default_factory=_utc_now)
+
+    # Membership index for evidence (kept in sync by the evidence methods)
+    _evidence_set: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate cause data."""
+        self._evidence_set = set(self.evidence)
         if self.depth < 1 or self.depth > 5:
             raise ValueError(f"Cause depth must be 1-5, got: {self.depth}")
         if self.hfacs_code and not is_valid_hfacs_code(self.hfacs_code):
@@ -77,13 +90,15 @@ class Cause:
 
     def add_evidence(self, evidence: str) -> None:
         """Add evidence supporting this cause."""
-        if evidence not in self.evidence:
+        if evidence not in self._evidence_set:
+            self._evidence_set.add(evidence)
             self.evidence.append(evidence)
             self._touch()
 
     def remove_evidence(self, evidence: str) -> None:
         """Remove evidence."""
-        if evidence in self.evidence:
+        if evidence in self._evidence_set:
+            self._evidence_set.discard(evidence)
             self.evidence.remove(evidence)
             self._touch()
 
@@ -124,7 +139,7 @@ class Cause:
 
     def _touch(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = datetime.now(_UTC)
 
     # === Factory Methods ===
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from rootcause_mcp.domain.value_objects.identifiers import (
     FishboneId,
@@ -17,8 +18,22 @@ from rootcause_mcp.domain.value_objects.identifiers import (
 from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
 from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@dataclass
+_UTC = timezone.utc
+_T = TypeVar("_T")
+
+# 6M categories in definition order
+_FB_CATS: tuple[FishboneCategoryType, ...] = tuple(FishboneCategoryType)
+
+
+def _utc_now() -> datetime:
+    """Current time in UTC (dataclass default factory)."""
+    return datetime.now(_UTC)
+
+
+@dataclass(slots=True)
 class FishboneCause:
     """
     A cause within a Fishbone category.
@@ -47,11 +62,11 @@ class FishboneCause:
     depth: int = 1
 
     # Metadata
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utc_now)
+    updated_at: datetime = field(default_factory=_utc_now)
 
 
-@dataclass
+@dataclass(slots=True)
 class FishboneCategory:
     """
     A category (bone) in the Fishbone diagram.
@@ -62,24 +77,50 @@ class FishboneCategory:
     category: FishboneCategoryType
     causes: list[FishboneCause] = field(default_factory=list)
 
+    # Cause ID -> position of its first occurrence in causes
+    _index: dict[CauseId, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Owning diagram, whose memoized queries follow this category's causes
+    _owner: Fishbone | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index causes passed in at construction."""
+        self._reindex(0)
+
     def add_cause(self, cause: FishboneCause) -> None:
         """Add a cause to this category."""
+        self._index.setdefault(cause.cause_id, len(self.causes))
         self.causes.append(cause)
+        if self._owner is not None:
+            self._owner._invalidate()
 
     def remove_cause(self, cause_id: CauseId) -> bool:
         """Remove a cause by ID."""
-        for i, cause in enumerate(self.causes):
-            if cause.cause_id == cause_id:
-                self.causes.pop(i)
-                return True
-        return False
+        i = self._index.pop(cause_id, None)
+        if i is None:
+            return False
+        self.causes.pop(i)
+        self._reindex(i)
+        if self._owner is not None:
+            self._owner._invalidate()
+        return True
 
     def get_cause(self, cause_id: CauseId) -> FishboneCause | None:
         """Get a cause by ID."""
-        for cause in self.causes:
-            if cause.cause_id == cause_id:
-                return cause
-        return None
+        i = self._index.get(cause_id)
+        return self.causes[i] if i is not None else None
+
+    def _reindex(self, start: int) -> None:
+        """Refresh index entries for causes from position start onward."""
+        for i in range(start, len(self.causes)):
+            cause_id = self.causes[i].cause_id
+            current = self._index.get(cause_id)
+            if current is None or current > i:
+                self._index[cause_id] = i
 
     @property
     def cause_count(self) -> int:
@@ -92,12 +133,18 @@ class FishboneCategory:
         return len(self.causes) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Fishbone:
     """
     Complete Fishbone Diagram.
 
     Contains all 6M categories and their causes.
+
+    Aggregate queries are memoized per version; the version moves on
+    every cause added or removed, whether through the Fishbone methods
+    or directly on one of its categories. Queries that read cause fields
+    (verified, hfacs_code) are not memoized, since those fields can be
+    assigned directly.
     """
 
     # Identity
@@ -111,14 +158,23 @@ class Fishbone:
     )
 
     # Metadata
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utc_now)
+    updated_at: datetime = field(default_factory=_utc_now)
+
+    # Memoization of aggregate queries: key -> (version, value)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _cache: dict[str, tuple[int, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize all 6M categories."""
         if not self.categories:
-            for cat_type in FishboneCategoryType:
-                self.categories[cat_type] = FishboneCategory(category=cat_type)
+            self.categories = {
+                cat_type: FishboneCategory(category=cat_type) for cat_type in _FB_CATS
+            }
+        for category in self.categories.values():
+            category._owner = self
 
     # === Category Management ===
 
@@ -151,55 +207,91 @@ class Fishbone:
     @property
     def total_cause_count(self) -> int:
         """Get total number of causes across all categories."""
-        return sum(cat.cause_count for cat in self.categories.values())
+        return self._memo(
+            "total_cause_count",
+            lambda: sum(cat.cause_count for cat in self.categories.values()),
+        )
 
     @property
     def populated_categories(self) -> list[FishboneCategoryType]:
         """Get list of categories that have causes."""
-        return [
-            cat_type
-            for cat_type, cat in self.categories.items()
-            if cat.has_causes
-        ]
+        return list(self._partition_categories()[0])
 
     @property
     def empty_categories(self) -> list[FishboneCategoryType]:
         """Get list of categories without causes."""
-        return [
-            cat_type
-            for cat_type, cat in self.categories.items()
-            if not cat.has_causes
-        ]
+        return list(self._partition_categories()[1])
 
     @property
     def coverage_ratio(self) -> float:
         """Get ratio of populated categories (0.0 - 1.0)."""
-        return len(self.populated_categories) / len(FishboneCategoryType)
+        return self._memo(
+            "coverage_ratio",
+            lambda: len(self._partition_categories()[0]) / len(_FB_CATS),
+        )
 
     def get_all_causes(self) -> list[FishboneCause]:
         """Get all causes from all categories."""
-        causes: list[FishboneCause] = []
-        for category in self.categories.values():
-            causes.extend(category.causes)
-        return causes
+        return list(self._all_causes())
 
     def get_verified_causes(self) -> list[FishboneCause]:
         """Get all verified causes."""
-        return [cause for cause in self.get_all_causes() if cause.verified]
+        return [cause for cause in self._all_causes() if cause.verified]
 
     def get_causes_by_hfacs_level(self, level_prefix: str) -> list[FishboneCause]:
         """Get causes filtered by HFACS level prefix (e.g., 'OI', 'US', 'PC', 'UA')."""
         return [
             cause
-            for cause in self.get_all_causes()
+            for cause in self._all_causes()
             if cause.hfacs_code and cause.hfacs_code.startswith(level_prefix)
         ]
 
     # === Private Methods ===
 
     def _touch(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc)
+        """Update the updated_at timestamp and invalidate memoized queries."""
+        self.updated_at = datetime.now(_UTC)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Invalidate memoized queries."""
+        self._version += 1
+
+    def _memo(self, key: str, compute: Callable[[], _T]) -> _T:
+        """Return the cached value for key, recomputing it if stale."""
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]  # type: ignore[no-any-return]
+        value = compute()
+        self._cache[key] = (self._version, value)
+        return value
+
+    def _all_causes(self) -> tuple[FishboneCause, ...]:
+        """All causes in category order (memoized)."""
+        return self._memo(
+            "all_causes",
+            lambda: tuple(
+                cause
+                for category in self.categories.values()
+                for cause in category.causes
+            ),
+        )
+
+    def _partition_categories(
+        self,
+    ) -> tuple[tuple[FishboneCategoryType, ...], tuple[FishboneCategoryType, ...]]:
+        """Populated and empty categories from one pass (memoized)."""
+
+        def build() -> tuple[
+            tuple[FishboneCategoryType, ...], tuple[FishboneCategoryType, ...]
+        ]:
+            populated: list[FishboneCategoryType] = []
+            empty: list[FishboneCategoryType] = []
+            for cat_type, cat in self.categories.items():
+                (populated if cat.causes else empty).append(cat_type)
+            return tuple(populated), tuple(empty)
+
+        return self._memo("partition", build)
 
     # === Factory Methods ===
 
@@ -18,8 +18,19 @@ from rootcause_mcp.domain.value_objects.enums import (
     StageStatus,
 )
 
+_UTC = timezone.utc
 
-@dataclass
+# Stages in workflow order
+_STAGES: tuple[Stage, ...] = tuple(Stage)
+_STAGE_IDX: dict[Stage, int] = {stage: i for i, stage in enumerate(_STAGES)}
+
+
+def _utc_now() -> datetime:
+    """Current time in UTC (dataclass default factory)."""
+    return datetime.now(_UTC)
+
+
+@dataclass(slots=True)
 class StageRecord:
     """Record of a stage's data and status."""
 
@@ -34,12 +45,12 @@ class StageRecord:
     def start(self) -> None:
         """Mark stage as in progress."""
         self.status = StageStatus.IN_PROGRESS
-        self.started_at = datetime.now(timezone.utc)
+        self.started_at = datetime.now(_UTC)
 
     def complete(self) -> None:
         """Mark stage as completed."""
         self.status = StageStatus.COMPLETED
-        self.completed_at = datetime.now(timezone.utc)
+        self.completed_at = datetime.now(_UTC)
 
     def fail(self, errors: list[str]) -> None:
         """Mark stage as failed with validation errors."""
@@ -52,7 +63,7 @@ class StageRecord:
         return self.status == StageStatus.COMPLETED
 
 
-@dataclass
+@dataclass(slots=True)
 class RCASession:
     """
     Root Cause Analysis Session - Aggregate Root.
@@ -78,15 +89,14 @@ class RCASession:
     stage_records: dict[Stage, StageRecord] = field(default_factory=dict)
 
     # Metadata
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utc_now)
+    updated_at: datetime = field(default_factory=_utc_now)
     created_by: str = ""
 
     def __post_init__(self) -> None:
         """Initialize stage records for all stages."""
         if not self.stage_records:
-            for stage in Stage:
-                self.stage_records[stage] = StageRecord(stage=stage)
+            self.stage_records = {stage: StageRecord(stage=stage) for stage in _STAGES}
             # Auto-start first stage
             self.stage_records[Stage.GATHER].start()
 
@@ -128,9 +138,7 @@ class RCASession:
             return False
 
         # Clear stages after target
-        stages = list(Stage)
-        target_idx = stages.index(target_stage)
-        for stage in stages[target_idx + 1 :]:
+        for stage in _STAGES[_STAGE_IDX[target_stage] + 1 :]:
             self.stage_records[stage] = StageRecord(stage=stage)
 
         # Reset current stage
@@ -194,14 +202,14 @@ class RCASession:
     def get_progress(self) -> dict[str, str]:
         """Get progress of all stages."""
         return {
-            stage.value: self.stage_records[stage].status.value for stage in Stage
+            stage.value: self.stage_records[stage].status.value for stage in _STAGES
         }
 
     def get_completed_stages(self) -> list[Stage]:
         """Get list of completed stages."""
         return [
             stage
-            for stage in Stage
+            for stage in _STAGES
             if self.stage_records[stage].status == StageStatus.COMPLETED
         ]
 
@@ -209,7 +217,7 @@ class RCASession:
 
     def _touch(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = datetime.now(_UTC)
 
     # === Factory Methods ===
 
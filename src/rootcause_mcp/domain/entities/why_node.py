@@ -8,12 +8,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from rootcause_mcp.domain.value_objects.enums import CausalLinkType, TeachingLevel
 from rootcause_mcp.domain.value_objects.identifiers import CauseId, SessionId
 from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @dataclass(frozen=True, slots=True)
 class CausalLink:
@@ -95,7 +98,7 @@ class TeachingCase:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WhyNode:
     """
     A node in the 5-Why analysis tree.
@@ -125,36 +128,63 @@ class WhyNode:
     needs_further_analysis: bool = True  # True if more "why" questions needed
     is_proximate: bool = False  # True if this is a proximate (direct) cause (Level 1-2)
 
-    # Metadata
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Metadata (filled in with a single shared timestamp when omitted)
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    # Membership index for evidence (kept in sync by add_evidence)
+    _evidence_set: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    # Owning chain, whose counters follow this node's status changes
+    _chain: WhyChain | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Validate WhyNode data."""
+        """Validate WhyNode data and fill in missing timestamps."""
         if self.level < 1 or self.level > 5:
             raise ValueError(f"Why level must be 1-5, got: {self.level}")
+        self._evidence_set = set(self.evidence)
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now(UTC)
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
 
     # === Evidence Management ===
 
     def add_evidence(self, evidence: str) -> None:
         """Add supporting evidence."""
-        if evidence not in self.evidence:
+        if evidence not in self._evidence_set:
+            self._evidence_set.add(evidence)
             self.evidence.append(evidence)
             self._touch()
 
+    def add_evidence_bulk(self, items: Iterable[str]) -> None:
+        """Add several pieces of evidence, updating the timestamp once."""
+        added = False
+        for evidence in items:
+            if evidence not in self._evidence_set:
+                self._evidence_set.add(evidence)
+                self.evidence.append(evidence)
+                added = True
+        if added:
+            self._touch()
+
     # === Root Cause Identification ===
 
     def mark_as_root_cause(self, confidence: float = 0.8) -> None:
         """Mark this node as a root cause."""
-        self.is_root_cause = True
-        self.needs_further_analysis = False
+        self._set_status(is_root_cause=True, needs_further_analysis=False)
         self.confidence = ConfidenceScore(confidence)
         self._touch()
 
     def mark_needs_analysis(self) -> None:
         """Mark that this node needs further "why" analysis."""
-        self.is_root_cause = False
-        self.needs_further_analysis = True
+        self._set_status(is_root_cause=False, needs_further_analysis=True)
         self._touch()
 
     # === Queries ===
@@ -187,6 +217,16 @@ class WhyNode:
         """Update the updated_at timestamp."""
         self.updated_at = datetime.now(UTC)
 
+    def _set_status(self, is_root_cause: bool, needs_further_analysis: bool) -> None:
+        """Set status flags and update the owning chain's counters."""
+        chain = self._chain
+        if chain is not None:
+            chain._count(self, -1)
+        self.is_root_cause = is_root_cause
+        self.needs_further_analysis = needs_further_analysis
+        if chain is not None:
+            chain._count(self, 1)
+
     # === Factory Methods ===
 
     @classmethod
@@ -230,7 +270,7 @@ class WhyNode:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WhyChain:
     """
     A complete 5-Why analysis chain.
@@ -242,20 +282,54 @@ class WhyChain:
     initial_problem: str
     nodes: list[WhyNode] = field(default_factory=list)
     causal_links: list[CausalLink] = field(default_factory=list)
+    # Counters kept in sync by _attach/_detach and node status changes
+    _root_cause_count: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+    _needs_analysis_count: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+    _level_counts: list[int] = field(
+        default_factory=lambda: [0] * 6, init=False, repr=False, compare=False
+    )
+    _node_index: dict[CauseId, WhyNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Attach initial nodes to the chain."""
+        for node in self.nodes:
+            self._attach(node)
 
     def add_node(self, node: WhyNode) -> None:
         """Add a node to the chain."""
         self.nodes.append(node)
+        self._attach(node)
+
+    def add_nodes_bulk(self, nodes: Iterable[WhyNode]) -> None:
+        """Add several nodes to the chain."""
+        for node in nodes:
+            self.nodes.append(node)
+            self._attach(node)
+
+    def replace_node(self, node: WhyNode) -> bool:
+        """Replace the node with the same ID. Returns False if not found."""
+        for i, existing in enumerate(self.nodes):
+            if existing.id == node.id:
+                self._detach(existing)
+                self.nodes[i] = node
+                self._attach(node)
+                return True
+        return False
 
     def add_causal_link(self, link: CausalLink) -> None:
         """Add a directed or bidirectional causal link between existing nodes."""
-        existing_node_ids = {str(node.id) for node in self.nodes}
-        if str(link.source_id) not in existing_node_ids:
+        if link.source_id not in self._node_index:
             raise ValueError(
                 f"Source node {link.source_id} not found in chain "
                 f"with {len(self.nodes)} nodes"
             )
-        if str(link.target_id) not in existing_node_ids:
+        if link.target_id not in self._node_index:
             raise ValueError(
                 f"Target node {link.target_id} not found in chain "
                 f"with {len(self.nodes)} nodes"
@@ -266,33 +340,39 @@ class WhyChain:
     @property
     def depth(self) -> int:
         """Get the current depth of the analysis."""
-        if not self.nodes:
-            return 0
-        return max(node.level for node in self.nodes)
+        counts = self._level_counts
+        for level in range(len(counts) - 1, 0, -1):
+            if counts[level]:
+                return level
+        return 0
+
+    @property
+    def root_cause_count(self) -> int:
+        """Get the number of identified root causes."""
+        return self._root_cause_count
 
     @property
     def root_causes(self) -> list[WhyNode]:
         """Get all identified root causes."""
+        if not self._root_cause_count:
+            return []
         return [node for node in self.nodes if node.is_root_cause]
 
     @property
     def needs_analysis(self) -> list[WhyNode]:
         """Get nodes that need further analysis."""
+        if not self._needs_analysis_count:
+            return []
         return [node for node in self.nodes if node.needs_further_analysis]
 
     @property
     def is_complete(self) -> bool:
         """Check if analysis is complete (all branches reach root cause or level 5)."""
-        if not self.nodes:
-            return False
-        return len(self.needs_analysis) == 0
+        return bool(self.nodes) and self._needs_analysis_count == 0
 
     def get_node(self, node_id: CauseId) -> WhyNode | None:
         """Get a node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._node_index.get(node_id)
 
     def get_chain_to_root(self, root_node: WhyNode) -> list[WhyNode]:
         """Get the chain of nodes from first why to a specific root cause."""
@@ -303,13 +383,14 @@ class WhyChain:
         current = root_node
 
         while current.parent_id:
-            parent = self.get_node(current.parent_id)
+            parent = self._node_index.get(current.parent_id)
             if parent:
-                chain.insert(0, parent)
+                chain.append(parent)
                 current = parent
             else:
                 break
 
+        chain.reverse()
         return chain
 
     def detect_feedback_loops(self) -> list[FeedbackLoop]:
@@ -469,26 +550,55 @@ class WhyChain:
             source_node_ids=tuple(str(node.id) for node in root_nodes),
         )
 
+    def _attach(self, node: WhyNode) -> None:
+        """Link a node to this chain, indexing it and counting root causes."""
+        node._chain = self
+        self._node_index.setdefault(node.id, node)
+        self._count(node, 1)
+
+    def _detach(self, node: WhyNode) -> None:
+        """Unlink a node from this chain."""
+        node._chain = None
+        if self._node_index.get(node.id) is node:
+            del self._node_index[node.id]
+        self._count(node, -1)
+
+    def _count(self, node: WhyNode, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a node from the counters."""
+        self._level_counts[node.level] += sign
+        if node.is_root_cause:
+            self._root_cause_count += sign
+        if node.needs_further_analysis:
+            self._needs_analysis_count += sign
+
     def to_dict(self) -> dict[str, object]:
         """Export WhyChain to dictionary format."""
-        return {
-            "initial_problem": self.initial_problem,
-            "depth": self.depth,
-            "is_complete": self.is_complete,
-            "nodes": [
+        nodes: list[dict[str, object]] = []
+        root_causes: list[str] = []
+        for node in self.nodes:
+            node_id = node.id.value
+            parent_id = node.parent_id
+            nodes.append(
                 {
-                    "id": str(node.id),
+                    "id": node_id,
                     "level": node.level,
                     "question": node.question,
                     "answer": node.answer,
                     "is_root_cause": node.is_root_cause,
                     "is_proximate": node.is_proximate,
                     "evidence": node.evidence,
-                    "parent_id": str(node.parent_id) if node.parent_id else None,
+                    "parent_id": parent_id.value if parent_id else None,
                 }
-                for node in self.nodes
-            ],
-            "root_causes": [str(node.id) for node in self.root_causes],
+            )
+            if node.is_root_cause:
+                root_causes.append(node_id)
+
+        return {
+            "initial_problem": self.initial_problem,
+            "depth": self.depth,
+            "is_complete": self.is_complete,
+            "nodes": nodes,
+            "root_causes": root_causes,
             "causal_links": [link.to_dict() for link in self.causal_links],
             "feedback_loops": [loop.to_dict() for loop in self.detect_feedback_loops()],
         }
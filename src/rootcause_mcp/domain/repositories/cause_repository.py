@@ -4,21 +4,22 @@ Cause Repository Interface.
 Abstract repository for Cause persistence.
 """
 
-from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Protocol, runtime_checkable
 
 from rootcause_mcp.domain.entities.cause import Cause
 from rootcause_mcp.domain.value_objects.identifiers import CauseId, SessionId
 from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
 
 
-class CauseRepository(ABC):
+@runtime_checkable
+class CauseRepository(Protocol):
     """
     Abstract repository for Causes.
 
     Implementations should be in the Infrastructure layer.
     """
 
-    @abstractmethod
     def save(self, cause: Cause) -> None:
         """
         Save a cause (create or update).
@@ -28,7 +29,15 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
+    def save_many(self, causes: Iterable[Cause]) -> None:
+        """
+        Save several causes (create or update) in one transaction.
+
+        Args:
+            causes: The Causes to save
+        """
+        ...
+
     def get(self, cause_id: CauseId) -> Cause | None:
         """
         Get a cause by ID.
@@ -41,7 +50,6 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def get_by_id(self, cause_id: str) -> Cause | None:
         """
         Get a cause by string ID.
@@ -54,7 +62,6 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def list_by_session(
         self,
         session_id: SessionId,
@@ -74,7 +81,6 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def list_by_parent(self, parent_id: CauseId) -> list[Cause]:
         """
         List all child causes of a parent.
@@ -87,7 +93,6 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def delete(self, cause_id: CauseId) -> bool:
         """
         Delete a cause.
@@ -102,7 +107,6 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def delete_by_session(self, session_id: SessionId) -> int:
         """
         Delete all causes for a session.
@@ -115,7 +119,6 @@ class CauseRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def count_by_session(
         self,
         session_id: SessionId,
@@ -4,20 +4,21 @@ Fishbone Repository Interface.
 Abstract repository for Fishbone diagram persistence.
 """
 
-from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Protocol, runtime_checkable
 
 from rootcause_mcp.domain.entities.fishbone import Fishbone
 from rootcause_mcp.domain.value_objects.identifiers import FishboneId, SessionId
 
 
-class FishboneRepository(ABC):
+@runtime_checkable
+class FishboneRepository(Protocol):
     """
     Abstract repository for Fishbone diagrams.
 
     Implementations should be in the Infrastructure layer.
     """
 
-    @abstractmethod
     def save(self, fishbone: Fishbone) -> None:
         """
         Save a fishbone diagram (create or update).
@@ -27,7 +28,15 @@ class FishboneRepository(ABC):
         """
         ...
 
-    @abstractmethod
+    def save_many(self, fishbones: Iterable[Fishbone]) -> None:
+        """
+        Save several fishbone diagrams (create or update) in one transaction.
+
+        Args:
+            fishbones: The Fishbones to save
+        """
+        ...
+
     def get(self, fishbone_id: FishboneId) -> Fishbone | None:
         """
         Get a fishbone by ID.
@@ -40,7 +49,6 @@ class FishboneRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def get_by_session(self, session_id: SessionId) -> Fishbone | None:
         """
         Get the fishbone diagram for a session.
@@ -55,7 +63,6 @@ class FishboneRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def delete(self, fishbone_id: FishboneId) -> bool:
         """
         Delete a fishbone diagram.
@@ -68,7 +75,6 @@ class FishboneRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def delete_by_session(self, session_id: SessionId) -> bool:
         """
         Delete the fishbone diagram for a session.
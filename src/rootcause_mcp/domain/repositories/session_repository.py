@@ -4,21 +4,21 @@ Session Repository Interface.
 Abstract repository for RCA Session persistence.
 """
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 from rootcause_mcp.domain.entities.session import RCASession
 from rootcause_mcp.domain.value_objects.identifiers import SessionId
 from rootcause_mcp.domain.value_objects.enums import SessionStatus, CaseType
 
 
-class SessionRepository(ABC):
+@runtime_checkable
+class SessionRepository(Protocol):
     """
     Abstract repository for RCA Sessions.
 
     Implementations should be in the Infrastructure layer.
     """
 
-    @abstractmethod
     def save(self, session: RCASession) -> None:
         """
         Save a session (create or update).
@@ -28,7 +28,6 @@ class SessionRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def get(self, session_id: SessionId) -> RCASession | None:
         """
         Get a session by ID.
@@ -41,7 +40,6 @@ class SessionRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def get_by_id(self, session_id: str) -> RCASession | None:
         """
         Get a session by string ID.
@@ -56,7 +54,6 @@ class SessionRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def list_all(
         self,
         status: SessionStatus | None = None,
@@ -78,7 +75,6 @@ class SessionRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def delete(self, session_id: SessionId) -> bool:
         """
         Delete a session.
@@ -91,7 +87,6 @@ class SessionRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def count(
         self,
         status: SessionStatus | None = None,
@@ -109,7 +104,6 @@ class SessionRepository(ABC):
         """
         ...
 
-    @abstractmethod
     def exists(self, session_id: SessionId) -> bool:
         """
         Check if a session exists.
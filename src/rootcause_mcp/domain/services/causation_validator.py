@@ -7,12 +7,25 @@ Validates causal relationships using the Counterfactual Testing Framework.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from secrets import token_hex
+from typing import TYPE_CHECKING
 
 from rootcause_mcp.domain.value_objects.enums import VerificationResult, CausalStrength
 from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_NO_TIME = timedelta(0)
+_ONE_MINUTE = timedelta(minutes=1)
+
+# MVP placeholder content for checks that the Agent completes
+_MECHANISM_MIDDLE = "[需要 Agent 補充中間步驟]"
+_SUFFICIENCY_CONFOUNDERS: tuple[str, ...] = ("[需要 Agent 識別其他必要因素]",)
+_SUFFICIENCY_CONCLUSION = "MVP 階段：假設原因為貢獻因素而非充分條件"
+
 
 class VerificationLevel(str, Enum):
     """Level of verification depth."""
@@ -21,7 +34,7 @@ class VerificationLevel(str, Enum):
     COMPREHENSIVE = "comprehensive"  # All 4 tests
 
 
-@dataclass
+@dataclass(slots=True)
 class CauseEvent:
     """An event in a causal relationship."""
 
@@ -30,7 +43,7 @@ class CauseEvent:
     evidence: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporalityResult:
     """Result of temporality check."""
 
@@ -41,7 +54,7 @@ class TemporalityResult:
     conclusion: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NecessityResult:
     """Result of necessity (counterfactual) check."""
 
@@ -52,7 +65,7 @@ class NecessityResult:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MechanismResult:
     """Result of mechanism plausibility check."""
 
@@ -62,7 +75,7 @@ class MechanismResult:
     domain_knowledge_support: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SufficiencyResult:
     """Result of sufficiency check."""
 
@@ -72,7 +85,11 @@ class SufficiencyResult:
     conclusion: str
 
 
-@dataclass
+# Any single counterfactual test result
+_TestResult = TemporalityResult | NecessityResult | MechanismResult | SufficiencyResult
+
+
+@dataclass(slots=True)
 class VerificationTestResults:
     """All test results from causation verification."""
 
@@ -82,7 +99,7 @@ class VerificationTestResults:
     sufficiency: SufficiencyResult | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CausationVerificationResult:
     """Complete result of causation verification."""
 
@@ -99,6 +116,30 @@ class CausationVerificationResult:
     caveats: list[str] | None = None
 
 
+# (condition, recommended step) pairs, checked in order by _get_next_steps
+_NEXT_STEP_RULES: tuple[tuple[Callable[[VerificationTestResults], bool], str], ...] = (
+    (
+        lambda t: t.temporality is not None and not t.temporality.passed,
+        "重新確認事件發生的時間順序",
+    ),
+    (
+        lambda t: t.necessity is not None and t.necessity.confidence.value < 0.7,
+        "收集更多證據以支持因果必要性",
+    ),
+    (
+        lambda t: t.mechanism is not None
+        and not t.mechanism.domain_knowledge_support,
+        "查詢領域知識以驗證因果機制",
+    ),
+    (
+        lambda t: t.sufficiency is not None
+        and bool(t.sufficiency.confounders_identified),
+        "分析識別出的其他因素是否也是必要條件",
+    ),
+)
+_NEXT_STEP_DEFAULT = "因果關係已充分驗證，可進行下一步分析"
+
+
 class CausationValidator:
     """
     Domain service for validating causal relationships.
@@ -127,9 +168,7 @@ class CausationValidator:
         Returns:
             CausationVerificationResult with test results and overall verdict
         """
-        import uuid
-
-        verification_id = f"ver_{uuid.uuid4().hex[:8]}"
+        verification_id = f"ver_{token_hex(4)}"
         tests = VerificationTestResults()
 
         # Always run temporality check
@@ -153,7 +192,7 @@ class CausationValidator:
         tests.necessity = self._check_necessity(cause, effect)
 
         # For standard level, stop here
-        if level == VerificationLevel.STANDARD:
+        if level is VerificationLevel.STANDARD:
             return self._build_result(
                 verification_id, level, cause, effect, tests
             )
@@ -174,16 +213,17 @@ class CausationValidator:
         """Check if cause precedes effect temporally."""
         # If timestamps are available, do precise check
         if cause.timestamp and effect.timestamp:
-            time_diff = (effect.timestamp - cause.timestamp).total_seconds() / 60
-            passed = time_diff > 0
+            delta = effect.timestamp - cause.timestamp
+            passed = delta > _NO_TIME
+            minutes = delta // _ONE_MINUTE if passed else None
 
             return TemporalityResult(
                 passed=passed,
                 cause_time=cause.timestamp,
                 effect_time=effect.timestamp,
-                time_diff_minutes=int(time_diff) if passed else None,
+                time_diff_minutes=minutes,
                 conclusion=(
-                    f"時序正確：原因在結果前 {int(time_diff)} 分鐘發生"
+                    f"時序正確：原因在結果前 {minutes} 分鐘發生"
                     if passed
                     else "時序錯誤：結果發生在原因之前"
                 ),
@@ -237,7 +277,7 @@ class CausationValidator:
             passed=True,  # Default to passed, needs Agent to provide pathway
             causal_pathway=[
                 cause.description,
-                "[需要 Agent 補充中間步驟]",
+                _MECHANISM_MIDDLE,
                 effect.description,
             ],
             mechanism_plausibility="medium",
@@ -258,8 +298,8 @@ class CausationValidator:
         return SufficiencyResult(
             passed=False,  # Conservative: assume not sufficient alone
             analysis=f"分析「{cause.description}」是否足以單獨導致「{effect.description}」",
-            confounders_identified=["[需要 Agent 識別其他必要因素]"],
-            conclusion="MVP 階段：假設原因為貢獻因素而非充分條件",
+            confounders_identified=list(_SUFFICIENCY_CONFOUNDERS),
+            conclusion=_SUFFICIENCY_CONCLUSION,
         )
 
     def _build_result(
@@ -271,29 +311,26 @@ class CausationValidator:
         tests: VerificationTestResults,
     ) -> CausationVerificationResult:
         """Build the final verification result based on test outcomes."""
-        # Count passed tests
+        # Count passed tests and collect caveats for failed ones in one pass
+        checks: tuple[tuple[_TestResult | None, str | None], ...] = (
+            (tests.temporality, None),
+            (tests.necessity, "必要性測試未通過"),
+            (tests.mechanism, "機制性測試未通過"),
+            (tests.sufficiency, "充分性測試未通過，可能存在其他必要因素"),
+        )
         passed_count = 0
         total_count = 0
-
-        if tests.temporality:
-            total_count += 1
-            if tests.temporality.passed:
-                passed_count += 1
-
-        if tests.necessity:
+        caveats: list[str] | None = None
+        for test, caveat in checks:
+            if test is None:
+                continue
             total_count += 1
-            if tests.necessity.passed:
-                passed_count += 1
-
-        if tests.mechanism:
-            total_count += 1
-            if tests.mechanism.passed:
-                passed_count += 1
-
-        if tests.sufficiency:
-            total_count += 1
-            if tests.sufficiency.passed:
+            if test.passed:
                 passed_count += 1
+            elif caveat:
+                if caveats is None:
+                    caveats = []
+                caveats.append(caveat)
 
         # Determine overall result
         if passed_count == 0:
@@ -312,15 +349,6 @@ class CausationValidator:
             strength = CausalStrength.CONTRIBUTING_FACTOR
             interpretation = "因果關係部分驗證，存在注意事項"
 
-        # Build caveats
-        caveats: list[str] = []
-        if tests.necessity and not tests.necessity.passed:
-            caveats.append("必要性測試未通過")
-        if tests.mechanism and not tests.mechanism.passed:
-            caveats.append("機制性測試未通過")
-        if tests.sufficiency and not tests.sufficiency.passed:
-            caveats.append("充分性測試未通過，可能存在其他必要因素")
-
         return CausationVerificationResult(
             verification_id=verification_id,
             verification_level=level,
@@ -332,26 +360,10 @@ class CausationValidator:
             causal_strength=strength,
             interpretation=interpretation,
             next_steps=self._get_next_steps(tests),
-            caveats=caveats if caveats else None,
+            caveats=caveats,
         )
 
     def _get_next_steps(self, tests: VerificationTestResults) -> list[str]:
         """Get recommended next steps based on test results."""
-        steps: list[str] = []
-
-        if tests.temporality and not tests.temporality.passed:
-            steps.append("重新確認事件發生的時間順序")
-
-        if tests.necessity and tests.necessity.confidence.value < 0.7:
-            steps.append("收集更多證據以支持因果必要性")
-
-        if tests.mechanism and not tests.mechanism.domain_knowledge_support:
-            steps.append("查詢領域知識以驗證因果機制")
-
-        if tests.sufficiency and tests.sufficiency.confounders_identified:
-            steps.append("分析識別出的其他因素是否也是必要條件")
-
-        if not steps:
-            steps.append("因果關係已充分驗證，可進行下一步分析")
-
-        return steps
+        steps = [step for applies, step in _NEXT_STEP_RULES if applies(tests)]
+        return steps or [_NEXT_STEP_DEFAULT]
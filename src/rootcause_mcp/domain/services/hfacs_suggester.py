@@ -8,12 +8,20 @@ Loads rules from YAML configuration files for flexibility and learning.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
 from rootcause_mcp.domain.value_objects.hfacs import (
     HFACSCode,
@@ -22,8 +30,11 @@ from rootcause_mcp.domain.value_objects.hfacs import (
 )
 from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
-@dataclass
+@dataclass(slots=True)
 class HFACSSuggestion:
     """A suggested HFACS code with confidence score."""
 
@@ -33,7 +44,7 @@ class HFACSSuggestion:
     source: str = "base"  # base | domain | learned
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordRule:
     """A keyword-to-HFACS mapping rule."""
     
@@ -45,7 +56,7 @@ class KeywordRule:
     domain: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchingConfig:
     """Configuration for keyword matching."""
     
@@ -58,15 +69,89 @@ class MatchingConfig:
 
 
 # 6M to HFACS Level Mapping
-CATEGORY_LEVEL_MAPPING: dict[FishboneCategoryType, list[HFACSLevel]] = {
-    FishboneCategoryType.PERSONNEL: [HFACSLevel.LEVEL_1, HFACSLevel.LEVEL_2],
-    FishboneCategoryType.EQUIPMENT: [HFACSLevel.LEVEL_4],
-    FishboneCategoryType.MATERIAL: [HFACSLevel.LEVEL_4],
-    FishboneCategoryType.PROCESS: [HFACSLevel.LEVEL_4, HFACSLevel.LEVEL_3],
-    FishboneCategoryType.ENVIRONMENT: [HFACSLevel.LEVEL_2, HFACSLevel.LEVEL_4],
-    FishboneCategoryType.MONITORING: [HFACSLevel.LEVEL_3, HFACSLevel.LEVEL_4],
+CATEGORY_LEVEL_MAPPING: dict[FishboneCategoryType, frozenset[HFACSLevel]] = {
+    FishboneCategoryType.PERSONNEL: frozenset({HFACSLevel.LEVEL_1, HFACSLevel.LEVEL_2}),
+    FishboneCategoryType.EQUIPMENT: frozenset({HFACSLevel.LEVEL_4}),
+    FishboneCategoryType.MATERIAL: frozenset({HFACSLevel.LEVEL_4}),
+    FishboneCategoryType.PROCESS: frozenset({HFACSLevel.LEVEL_4, HFACSLevel.LEVEL_3}),
+    FishboneCategoryType.ENVIRONMENT: frozenset({HFACSLevel.LEVEL_2, HFACSLevel.LEVEL_4}),
+    FishboneCategoryType.MONITORING: frozenset({HFACSLevel.LEVEL_3, HFACSLevel.LEVEL_4}),
+}
+
+# Fishbone 6M category id -> HFACS codes its keywords map to
+_FISHBONE_HFACS_CODES: dict[str, tuple[str, ...]] = {
+    "MAN": ("UA-SBE", "PP-AMS"),
+    "METHOD": ("OF-OP", "US-IP"),
+    "MACHINE": ("EF-PMI", "OF-RM"),
+    "MATERIAL": ("OF-RM",),
+    "MEASUREMENT": ("EF-PMI", "US-IS"),
+    "MILIEU": ("EF-PE",),
+}
+
+# YAML level number (int, or its string form) -> HFACSLevel
+_LEVEL_BY_NUM: dict[int | str, HFACSLevel] = {
+    key: level
+    for level in HFACSLevel
+    for num in [level.value.removeprefix("Level ")]
+    for key in (num, int(num))
 }
 
+# Tie-break order for suggestions with equal confidence
+_SOURCE_PRIORITY: dict[str, int] = {"learned": 0, "domain": 1, "base": 2}
+
+# YAML files that rules and matching config are loaded from
+_RULE_FILES = (
+    "keyword_rules.yaml",
+    "hfacs_mes.yaml",
+    "fishbone_6m.yaml",
+    "learned_rules.yaml",
+)
+
+# Last parsed (file signature, rules, code info, config) per
+# (config dir, active domains); reused while the rule files are unchanged
+_RULES_CACHE: dict[
+    tuple[Path, tuple[str, ...] | None],
+    tuple[
+        tuple[tuple[int, int] | None, ...],
+        list[KeywordRule],
+        dict[str, dict[str, Any]],
+        MatchingConfig,
+    ],
+] = {}
+
+# Parsed YAML documents per file, keyed by (mtime, size); shared between
+# suggesters with different active domains. Treat the data as read-only.
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the safe loader (libyaml-backed when available)."""
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = path.resolve()
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[key] = (signature, data)
+    return data
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """Locate config/hfacs once per process."""
+    # Auto-detect: look for config/hfacs relative to this file
+    current_file = Path(__file__)
+    # Navigate up to find project root
+    for parent in current_file.parents:
+        candidate = parent / "config" / "hfacs"
+        if candidate.exists():
+            return candidate
+
+    # Fallback: assume current working directory
+    return Path("config/hfacs")
+
 
 class HFACSSuggester:
     """
@@ -81,6 +166,9 @@ class HFACSSuggester:
     3. Learned rules (from learned_rules.yaml)
     """
 
+    # Max cached suggest() results per suggester
+    _SUGGEST_CACHE_SIZE = 1024
+
     def __init__(
         self,
         config_dir: Path | str | None = None,
@@ -100,27 +188,54 @@ class HFACSSuggester:
         self.config = MatchingConfig()
         # Cache code info from YAML (avoids dependency on HFACS_CODE_TABLE)
         self.code_info_cache: dict[str, dict[str, Any]] = {}
+        # Normalized keyword -> indices into self.rules (built by _load_rules)
+        self._keyword_index: dict[str, list[int]] = {}
+        # Per rule: negated confidence, without and with the category boost,
+        # and source priority; negated so tuples sort best-first
+        self._rule_scores: list[tuple[float, float, int]] = []
+        # Substring-mode prefilter: leading bigram (or single char) -> keywords
+        self._gram_index: dict[str, list[str]] = {}
+        # Length of the shortest keyword; shorter descriptions match nothing
+        self._min_keyword_len = 0
+        # Keyword matcher for the configured matching_mode
+        self._match_keywords: Callable[[str], list[str]] = self._match_substring
+        # Rule code string -> HFACSCode, built at load (unknown codes omitted)
+        self._code_objects: dict[str, HFACSCode] = {}
+        # Compiled keyword patterns for regex mode, built on first use
+        self._keyword_patterns: list[tuple[str, re.Pattern[str]]] | None = None
+        # All regex keywords as one alternation, or None if they can't be fused
+        self._combined_pattern: re.Pattern[str] | None = None
+        # (description, category, max_suggestions) -> suggestions; treat
+        # cached suggestions as read-only
+        self._suggest_cache: OrderedDict[
+            tuple[str, FishboneCategoryType | None, int],
+            tuple[HFACSSuggestion, ...],
+        ] = OrderedDict()
         self._load_rules()
     
     def _resolve_config_dir(self, config_dir: Path | str | None) -> Path:
         """Resolve the config directory path."""
         if config_dir:
             return Path(config_dir)
-        
-        # Auto-detect: look for config/hfacs relative to this file
-        current_file = Path(__file__)
-        # Navigate up to find project root
-        for parent in current_file.parents:
-            candidate = parent / "config" / "hfacs"
-            if candidate.exists():
-                return candidate
-        
-        # Fallback: assume current working directory
-        return Path("config/hfacs")
+        return _default_config_dir()
     
     def _load_rules(self) -> None:
-        """Load all rules from YAML files."""
+        """Load all rules from YAML files (reusing unchanged parsed rule sets)."""
+        domains = tuple(self.active_domains) if self.active_domains else None
+        cache_key = (self.config_dir.resolve(), domains)
+        signature = self._rule_files_signature()
+        cached = _RULES_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            _, rules, code_info, config = cached
+            self.rules = list(rules)
+            self.code_info_cache = dict(code_info)
+            self.config = replace(config)
+            self._build_match_index()
+            return
+
         self.rules = []
+        self.code_info_cache = {}
+        self.config = MatchingConfig()
         
         # 1. Load keyword_rules.yaml (domain rules + config)
         keyword_rules_path = self.config_dir / "keyword_rules.yaml"
@@ -134,11 +249,85 @@ class HFACSSuggester:
         learned_rules_path = self.config_dir / "learned_rules.yaml"
         if learned_rules_path.exists():
             self._load_learned_rules(learned_rules_path)
+
+        _RULES_CACHE[cache_key] = (
+            signature,
+            list(self.rules),
+            dict(self.code_info_cache),
+            replace(self.config),
+        )
+        self._build_match_index()
+
+    def _rule_files_signature(self) -> tuple[tuple[int, int] | None, ...]:
+        """(mtime, size) of each rule file, None for missing files."""
+        signature: list[tuple[int, int] | None] = []
+        for name in _RULE_FILES:
+            try:
+                stat = (self.config_dir / name).stat()
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _build_match_index(self) -> None:
+        """Map each normalized keyword to its rules and reset match caches."""
+        case_sensitive = self.config.case_sensitive
+        self._keyword_index = {}
+        self._gram_index = {}
+        self._code_objects = {}
+        self._keyword_patterns = None
+        self._combined_pattern = None
+        self._suggest_cache = OrderedDict()
+        for rule_idx, rule in enumerate(self.rules):
+            keyword = rule.keyword if case_sensitive else rule.keyword.lower()
+            self._keyword_index.setdefault(keyword, []).append(rule_idx)
+        for code_str in dict.fromkeys(rule.code for rule in self.rules):
+            code = self._build_code(code_str)
+            if code is not None:
+                self._code_objects[code_str] = code
+        self._rule_scores = [
+            (
+                -self._adjust_confidence(rule, category_match=False),
+                -self._adjust_confidence(rule, category_match=True),
+                _SOURCE_PRIORITY.get(rule.source, 3),
+            )
+            for rule in self.rules
+        ]
+        # A keyword can only be a substring if its leading bigram occurs in
+        # the description, so one bucket per keyword is enough to prune
+        for keyword in self._keyword_index:
+            self._gram_index.setdefault(keyword[:2], []).append(keyword)
+        self._min_keyword_len = min(map(len, self._keyword_index), default=0)
+        mode = self.config.matching_mode
+        if mode == "exact":
+            self._match_keywords = self._match_exact
+        elif mode == "regex":
+            self._match_keywords = self._match_regex
+        else:
+            self._match_keywords = self._match_substring
+    
+    def _adjust_confidence(self, rule: KeywordRule, category_match: bool) -> float:
+        """Apply the category and source boosts to a rule's confidence."""
+        adjusted_confidence = rule.confidence
+        
+        # Boost for category match
+        if category_match:
+            adjusted_confidence = min(1.0, adjusted_confidence + 0.1)
+        
+        # Boost for learned rules (more trusted)
+        if rule.source == "learned":
+            adjusted_confidence = min(1.0, adjusted_confidence + 0.05)
+        
+        # Domain rules get priority if configured
+        if self.config.domain_priority and rule.source == "domain":
+            adjusted_confidence = min(1.0, adjusted_confidence + 0.02)
+        
+        return adjusted_confidence
     
     def _load_keyword_rules(self, path: Path) -> None:
         """Load domain-specific rules from keyword_rules.yaml."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
         
         # Load matching config
         if "matching_config" in data:
@@ -199,8 +388,7 @@ class HFACSSuggester:
     
     def _extract_keywords_from_framework(self, path: Path, framework: str) -> None:
         """Extract keyword rules and code info from a framework YAML file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
         
         taxonomy = data.get("taxonomy", {})
         
@@ -227,14 +415,17 @@ class HFACSSuggester:
                     "name_zh": name_zh,
                 }
                 
-                for keyword in keywords:
-                    self.rules.append(KeywordRule(
+                reason = f"基礎規則: {name_zh}"
+                self.rules.extend(
+                    KeywordRule(
                         keyword=keyword,
                         code=code_id,
                         confidence=base_confidence,
-                        reason=f"基礎規則: {name_zh}",
+                        reason=reason,
                         source="base",
-                    ))
+                    )
+                    for keyword in keywords
+                )
         
         # Traverse taxonomy structure
         for level_id, level_data in taxonomy.items():
@@ -259,8 +450,7 @@ class HFACSSuggester:
     
     def _extract_keywords_from_fishbone(self, path: Path) -> None:
         """Extract keyword rules from Fishbone 6M YAML."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
         
         categories = data.get("categories", {})
         
@@ -270,33 +460,23 @@ class HFACSSuggester:
             
             keywords = cat_data.get("keywords", [])
             name_zh = cat_data.get("name_zh", cat_id)
+            target_codes = _FISHBONE_HFACS_CODES.get(cat_id, ())
+            reason = f"Fishbone {name_zh} 對應"
             
-            # Map Fishbone categories to HFACS levels
-            hfacs_mapping = {
-                "MAN": ["UA-SBE", "PP-AMS"],
-                "METHOD": ["OF-OP", "US-IP"],
-                "MACHINE": ["EF-PMI", "OF-RM"],
-                "MATERIAL": ["OF-RM"],
-                "MEASUREMENT": ["EF-PMI", "US-IS"],
-                "MILIEU": ["EF-PE"],
-            }
-            
-            target_codes = hfacs_mapping.get(cat_id, [])
-            
-            for keyword in keywords:
-                for code in target_codes:
-                    self.rules.append(KeywordRule(
-                        keyword=keyword,
-                        code=code,
-                        confidence=0.6,  # Lower confidence for indirect mapping
-                        reason=f"Fishbone {name_zh} 對應",
-                        source="base",
-                    ))
+            self.rules.extend(
+                KeywordRule(
+                    keyword=keyword,
+                    code=code,
+                    confidence=0.6,  # Lower confidence for indirect mapping
+                    reason=reason,
+                    source="base",
+                )
+                for keyword, code in product(keywords, target_codes)
+            )
     
     def _load_learned_rules(self, path: Path) -> None:
         """Load learned rules from learned_rules.yaml."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
         
         if not data:
             return
@@ -333,101 +513,175 @@ class HFACSSuggester:
             List of HFACSSuggestions sorted by confidence
         """
         max_suggestions = max_suggestions or self.config.max_suggestions
-        suggestions: list[HFACSSuggestion] = []
-        
+        key = (description, category, max_suggestions)
+        cache = self._suggest_cache
+        cached = cache.get(key)
+        if cached is None:
+            cached = self._compute_suggestions(description, category, max_suggestions)
+            cache[key] = cached
+            if len(cache) > self._SUGGEST_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return list(cached)
+
+    def _compute_suggestions(
+        self,
+        description: str,
+        category: FishboneCategoryType | None,
+        max_suggestions: int,
+    ) -> tuple[HFACSSuggestion, ...]:
+        """Match a description against the loaded rules (uncached)."""
         # Normalize description for matching
-        desc_normalized = description if self.config.case_sensitive else description.lower()
+        # (islower() means every cased character is already lowercase, so
+        # lower() would only copy the string)
+        if self.config.case_sensitive or description.islower():
+            desc_normalized = description
+        else:
+            desc_normalized = description.lower()
         
-        # Track keyword hits for multi-hit boost
-        code_hits: dict[str, int] = {}
-        
-        # Match keywords
-        for rule in self.rules:
-            keyword = rule.keyword if self.config.case_sensitive else rule.keyword.lower()
-            
-            matched = False
-            if self.config.matching_mode == "exact":
-                matched = keyword == desc_normalized
-            elif self.config.matching_mode == "regex":
-                matched = bool(re.search(keyword, desc_normalized))
-            else:  # substring
-                matched = keyword in desc_normalized
+        # Match each distinct keyword once, then visit matching rules in load order
+        index = self._keyword_index
+        matched_rules = sorted(
+            rule_idx
+            for keyword in self._match_keywords(desc_normalized)
+            for rule_idx in index[keyword]
+        )
+
+        # Matching rules grouped by code, as tuples that sort best-first:
+        # (-confidence, source priority, index, rule, code)
+        candidates: dict[
+            str, list[tuple[float, int, int, KeywordRule, HFACSCode]]
+        ] = {}
+        expected_levels = (
+            CATEGORY_LEVEL_MAPPING.get(category, frozenset()) if category else frozenset()
+        )
+
+        rules = self.rules
+        rule_scores = self._rule_scores
+        code_objects = self._code_objects
+        for rule_idx in matched_rules:
+            rule = rules[rule_idx]
+            code = code_objects.get(rule.code)
+            if code is None:
+                continue
             
-            if matched:
-                code_hits[rule.code] = code_hits.get(rule.code, 0) + 1
-                
-                # Try to get code from cache first, then fallback to HFACS_CODE_TABLE
-                code_info = self.code_info_cache.get(rule.code)
-                if code_info:
-                    # Build HFACSCode from cache
-                    level_num = code_info.get("level", 1)
-                    try:
-                        level = HFACSLevel(f"Level {level_num}")
-                    except ValueError:
-                        level = HFACSLevel.LEVEL_1
-                    
-                    code = HFACSCode(
-                        code=rule.code,
-                        level=level,
-                        category=str(code_info.get("category", "")),
-                        subcategory=str(code_info.get("subcategory", "")),
-                        description=str(code_info.get("description", "")),
-                    )
-                else:
-                    # Fallback to HFACS_CODE_TABLE
-                    try:
-                        code = HFACSCode.from_code(rule.code)
-                    except (ValueError, KeyError):
-                        continue
-                
-                # Calculate adjusted confidence
-                adjusted_confidence = rule.confidence
-                
-                # Boost for category match
-                if category:
-                    expected_levels = CATEGORY_LEVEL_MAPPING.get(category, [])
-                    if code.level in expected_levels:
-                        adjusted_confidence = min(1.0, adjusted_confidence + 0.1)
-                
-                # Boost for learned rules (more trusted)
-                if rule.source == "learned":
-                    adjusted_confidence = min(1.0, adjusted_confidence + 0.05)
-                
-                # Domain rules get priority if configured
-                if self.config.domain_priority and rule.source == "domain":
-                    adjusted_confidence = min(1.0, adjusted_confidence + 0.02)
-                
-                suggestions.append(HFACSSuggestion(
-                    code=code,
-                    confidence=ConfidenceScore(adjusted_confidence),
-                    reason=rule.reason,
-                    source=rule.source,
-                ))
+            # Boosted confidences are precomputed per rule
+            plain, boosted, priority = rule_scores[rule_idx]
+            candidates.setdefault(rule.code, []).append((
+                boosted if code.level in expected_levels else plain,
+                priority,
+                rule_idx,
+                rule,
+                code,
+            ))
         
-        # Apply multi-hit boost
-        for suggestion in suggestions:
-            hits = code_hits.get(suggestion.code.code, 1)
-            if hits > 1:
-                boost = self.config.multi_hit_boost * (hits - 1)
-                new_conf = min(1.0, float(suggestion.confidence) + boost)
-                suggestion.confidence = ConfidenceScore(new_conf)
+        # Apply multi-hit boost and keep the best candidate per code
+        # (highest confidence, then source priority, then load order;
+        # indices are unique, so rules and codes are never compared)
+        best: list[tuple[float, int, int, KeywordRule, HFACSCode]] = []
+        multi_hit_boost = self.config.multi_hit_boost
+        for code_candidates in candidates.values():
+            hits = len(code_candidates)
+            if hits == 1:
+                best.append(code_candidates[0])
+                continue
+            # Boost and pick the winner in one pass (clamping can create ties,
+            # so the boost must be applied before comparing)
+            boost = multi_hit_boost * (hits - 1)
+            best.append(min(
+                (-min(1.0, boost - neg_confidence), priority, rule_idx, rule, code)
+                for neg_confidence, priority, rule_idx, rule, code in code_candidates
+            ))
         
         # Sort by confidence (descending), then by source priority
-        source_priority = {"learned": 0, "domain": 1, "base": 2}
-        suggestions.sort(
-            key=lambda s: (-float(s.confidence), source_priority.get(s.source, 3))
-        )
-        
-        # Remove duplicates (keep highest confidence)
-        seen_codes: set[str] = set()
-        unique_suggestions: list[HFACSSuggestion] = []
-        for suggestion in suggestions:
-            if suggestion.code.code not in seen_codes:
-                if float(suggestion.confidence) >= self.config.min_confidence:
-                    seen_codes.add(suggestion.code.code)
-                    unique_suggestions.append(suggestion)
+        best.sort()
         
-        return unique_suggestions[:max_suggestions]
+        min_confidence = self.config.min_confidence
+        return tuple([
+            HFACSSuggestion(
+                code=code,
+                confidence=ConfidenceScore(-neg_confidence),
+                reason=rule.reason,
+                source=rule.source,
+            )
+            for neg_confidence, _, _, rule, code in best
+            if -neg_confidence >= min_confidence
+        ][:max_suggestions])
+
+    def _match_exact(self, text: str) -> list[str]:
+        """Keywords equal to the whole normalized description."""
+        return [text] if text in self._keyword_index else []
+
+    def _match_substring(self, text: str) -> list[str]:
+        """Keywords contained in the normalized description."""
+        if len(text) < self._min_keyword_len:
+            return []
+        grams = {text[i:i + 2] for i in range(len(text) - 1)}
+        grams.update(text)
+        grams.add("")
+        gram_index = self._gram_index
+        return [
+            keyword
+            for gram in grams
+            if gram in gram_index
+            for keyword in gram_index[gram]
+            if keyword in text
+        ]
+
+    def _match_regex(self, text: str) -> list[str]:
+        """Keywords whose pattern matches somewhere in the normalized description."""
+        if self._keyword_patterns is None:
+            self._compile_keyword_patterns()
+        assert self._keyword_patterns is not None
+        combined = self._combined_pattern
+        if combined is not None and not combined.search(text):
+            return []
+        return [
+            keyword
+            for keyword, pattern in self._keyword_patterns
+            if pattern.search(text)
+        ]
+
+    def _compile_keyword_patterns(self) -> None:
+        """Compile regex keywords, fusing them into one alternation if possible."""
+        patterns = [(keyword, re.compile(keyword)) for keyword in self._keyword_index]
+        self._keyword_patterns = patterns
+        # One scan rejects descriptions that match no keyword at all. Patterns
+        # with groups are left unfused since backreferences would renumber.
+        if not patterns or any(pattern.groups for _, pattern in patterns):
+            return
+        try:
+            self._combined_pattern = re.compile(
+                "|".join(f"(?:{keyword})" for keyword, _ in patterns)
+            )
+        except re.error:  # e.g. global inline flags mid-pattern
+            self._combined_pattern = None
+
+    def _build_code(self, code_str: str) -> HFACSCode | None:
+        """Build the HFACSCode for a rule's code, or None if it is unknown."""
+        # Try to get code from cache first, then fallback to HFACS_CODE_TABLE
+        code_info = self.code_info_cache.get(code_str)
+        if code_info:
+            # Build HFACSCode from cache
+            level = _LEVEL_BY_NUM.get(code_info.get("level", 1), HFACSLevel.LEVEL_1)
+
+            try:
+                return HFACSCode(
+                    code=code_str,
+                    level=level,
+                    category=str(code_info.get("category", "")),
+                    subcategory=str(code_info.get("subcategory", "")),
+                    description=str(code_info.get("description", "")),
+                )
+            except ValueError:  # malformed code id in YAML
+                return None
+
+        # Fallback to HFACS_CODE_TABLE
+        try:
+            return HFACSCode.from_code(code_str)
+        except (ValueError, KeyError):
+            return None
 
     def suggest_by_category(
         self,
@@ -439,7 +693,7 @@ class HFACSSuggester:
         Returns typical HFACS codes for a given Fishbone category.
         """
         suggestions: list[HFACSSuggestion] = []
-        expected_levels = CATEGORY_LEVEL_MAPPING.get(category, [])
+        expected_levels = CATEGORY_LEVEL_MAPPING.get(category, frozenset())
 
         for code_str, info in HFACS_CODE_TABLE.items():
             if info["level"] in expected_levels:
@@ -503,8 +757,10 @@ class HFACSSuggester:
         """Get a summary of loaded rules for debugging."""
         summary: dict[str, Any] = {
             "total_rules": len(self.rules),
-            "by_source": {},
-            "by_domain": {},
+            "by_source": dict(Counter(rule.source for rule in self.rules)),
+            "by_domain": dict(
+                Counter(rule.domain for rule in self.rules if rule.domain)
+            ),
             "config": {
                 "min_confidence": self.config.min_confidence,
                 "max_suggestions": self.config.max_suggestions,
@@ -512,14 +768,6 @@ class HFACSSuggester:
             }
         }
         
-        for rule in self.rules:
-            # By source
-            summary["by_source"][rule.source] = summary["by_source"].get(rule.source, 0) + 1
-            
-            # By domain
-            if rule.domain:
-                summary["by_domain"][rule.domain] = summary["by_domain"].get(rule.domain, 0) + 1
-        
         return summary
     
     def reload_rules(self) -> None:
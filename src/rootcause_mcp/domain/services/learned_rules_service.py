@@ -9,13 +9,28 @@ Learned Rules Service - 管理 HFACS 學習規則.
 
 from __future__ import annotations
 
+import hashlib
+import os
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from sys import intern
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 @dataclass
 class LearnedRule:
@@ -56,6 +71,53 @@ class RejectedRule:
     rejected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# source_type -> metadata.stats 計數欄位
+_SOURCE_STAT_KEYS: dict[str, str] = {
+    "agent": "from_agent",
+    "session": "from_session",
+    "manual": "from_manual",
+}
+
+
+def _index_rules(
+    rules: list[dict[str, Any]] | None,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """以 (keyword, code) 索引規則，重複時保留第一筆（並 intern 字串）."""
+    index: dict[tuple[str, str], dict[str, Any]] = {}
+    for rule in rules or []:
+        keyword, code = rule["keyword"], rule["code"]
+        if isinstance(keyword, str):
+            keyword = rule["keyword"] = intern(keyword)
+        if isinstance(code, str):
+            code = rule["code"] = intern(code)
+        index.setdefault((keyword, code), rule)
+    return index
+
+
+def _dump_section(key: str, value: Any) -> bytes:
+    """將單一頂層鍵輸出為 YAML（UTF-8）."""
+    text: str = yaml.dump(
+        {key: value},
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+    return text.encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """尋找 config/hfacs 目錄（每個行程只找一次）."""
+    current_file = Path(__file__)
+    for parent in current_file.parents:
+        candidate = parent / "config" / "hfacs"
+        if candidate.exists():
+            return candidate
+
+    return Path("config/hfacs")
+
+
 class LearnedRulesService:
     """
     管理學習規則的 Domain Service.
@@ -63,36 +125,58 @@ class LearnedRulesService:
     提供對 learned_rules.yaml 的 CRUD 操作。
     """
     
-    def __init__(self, config_dir: Path | str | None = None):
+    # 只有 hit_count 變動時，累積這麼多次才寫入檔案
+    HIT_FLUSH_EVERY = 16
+
+    def __init__(
+        self,
+        config_dir: Path | str | None = None,
+        durable: bool = False,
+    ):
         """
         初始化服務.
         
         Args:
             config_dir: config/hfacs 目錄路徑
+            durable: 存檔時是否 fsync，確保斷電後資料仍在
         """
         self.config_dir = self._resolve_config_dir(config_dir)
         self.rules_file = self.config_dir / "learned_rules.yaml"
+        self._durable = durable
+        # 規則檔在第一次使用時才載入
+        self._loaded = False
         self._data: dict[str, Any] = {}
-        self._load()
+        # self._data 內的三個規則清單，由 _load() 綁定
+        self._learned: list[dict[str, Any]] = []
+        self._pending: list[dict[str, Any]] = []
+        self._rejected: list[dict[str, Any]] = []
+        # (keyword, code) -> first matching entry in each rule list
+        self._learned_idx: dict[tuple[str, str], dict[str, Any]] = {}
+        self._pending_idx: dict[tuple[str, str], dict[str, Any]] = {}
+        self._rejected_idx: dict[tuple[str, str], dict[str, Any]] = {}
+        # 尚未寫入檔案的變更；batch() 內延後到離開時才寫入
+        self._dirty = False
+        self._batch_depth = 0
+        # 尚未寫入的 hit_count 更新次數
+        self._hit_dirty_count = 0
+        # 變更時已取得的時間（ISO 字串），存檔時沿用為 metadata.updated
+        self._updated_at: str | None = None
+        # learned_rules 的統計，隨新增/移除增量更新
+        self._stats: dict[str, int] = {}
+        # 上次寫入檔案的規則內容摘要（不含 metadata）
+        self._last_digest: bytes | None = None
     
     def _resolve_config_dir(self, config_dir: Path | str | None) -> Path:
         """解析設定目錄路徑."""
         if config_dir:
             return Path(config_dir)
-        
-        current_file = Path(__file__)
-        for parent in current_file.parents:
-            candidate = parent / "config" / "hfacs"
-            if candidate.exists():
-                return candidate
-        
-        return Path("config/hfacs")
+        return _default_config_dir()
     
     def _load(self) -> None:
         """載入學習規則檔案."""
         if self.rules_file.exists():
             with open(self.rules_file, "r", encoding="utf-8") as f:
-                self._data = yaml.safe_load(f) or {}
+                self._data = yaml.load(f.read(), Loader=_YamlLoader) or {}
         else:
             self._data = {
                 "metadata": {
@@ -109,35 +193,112 @@ class LearnedRulesService:
                 "pending_rules": [],
                 "rejected_rules": [],
             }
+        # 手動編輯可能留下空的鍵（值為 None），一律換成清單
+        self._learned = self._data["learned_rules"] = (
+            self._data.get("learned_rules") or []
+        )
+        self._pending = self._data["pending_rules"] = (
+            self._data.get("pending_rules") or []
+        )
+        self._rejected = self._data["rejected_rules"] = (
+            self._data.get("rejected_rules") or []
+        )
+        self._learned_idx = _index_rules(self._learned)
+        self._pending_idx = _index_rules(self._pending)
+        self._rejected_idx = _index_rules(self._rejected)
+        self._stats = {"total_rules": 0, **dict.fromkeys(_SOURCE_STAT_KEYS.values(), 0)}
+        for rule in self._learned:
+            self._count_learned(rule, 1)
+        # 檔案可能已被外部修改，下次存檔一律寫入
+        self._last_digest = None
+        self._loaded = True
+
+    def _ensure_loaded(self) -> None:
+        """尚未載入時載入規則檔."""
+        if not self._loaded:
+            self._load()
     
     def _save(self) -> None:
         """儲存學習規則檔案."""
+        updated_at = self._updated_at
+        self._updated_at = None
+        self._hit_dirty_count = 0
+
+        # 逐段輸出頂層鍵，串接結果與整份輸出相同；
+        # 規則內容與上次寫入相同時不必重寫（metadata 只差 updated 時間）
+        sections = {
+            key: _dump_section(key, value)
+            for key, value in self._data.items()
+            if key != "metadata"
+        }
+        digest = hashlib.blake2b(
+            b"".join(sections.values()), digest_size=16
+        ).digest()
+        if digest == self._last_digest:
+            return
+
         # 更新 metadata
-        self._data["metadata"]["updated"] = datetime.now(timezone.utc).isoformat()
+        self._data["metadata"]["updated"] = (
+            updated_at or datetime.now(timezone.utc).isoformat()
+        )
         self._update_stats()
+        payload = b"".join(
+            sections[key] if key in sections else _dump_section(key, value)
+            for key, value in self._data.items()
+        )
         
         # 確保目錄存在
         self.rules_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.rules_file, "w", encoding="utf-8") as f:
-            yaml.dump(
-                self._data,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-            )
+        # 先寫入暫存檔再替換，中途失敗不會留下寫一半的規則檔
+        tmp_file = self.rules_file.with_name(self.rules_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            if self._durable:
+                f.flush()
+                getattr(os, "fdatasync", os.fsync)(f.fileno())
+        tmp_file.replace(self.rules_file)
+        self._last_digest = digest
     
+    def _mark_dirty(self, now: str | None = None) -> None:
+        """標記有變更，不在 batch() 內時立即寫入."""
+        self._dirty = True
+        if now is not None:
+            self._updated_at = now
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """將尚未寫入的變更存檔."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator[LearnedRulesService]:
+        """
+        批次修改規則，離開時只寫入一次檔案.
+
+        可巢狀使用；最外層結束時才寫入。
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
     def _update_stats(self) -> None:
         """更新統計資訊."""
-        learned = self._data.get("learned_rules", [])
-        stats = {
-            "total_rules": len(learned),
-            "from_agent": sum(1 for r in learned if r.get("source_type") == "agent"),
-            "from_session": sum(1 for r in learned if r.get("source_type") == "session"),
-            "from_manual": sum(1 for r in learned if r.get("source_type") == "manual"),
-        }
-        self._data["metadata"]["stats"] = stats
+        self._data["metadata"]["stats"] = dict(self._stats)
+
+    def _count_learned(self, rule: dict[str, Any], delta: int) -> None:
+        """依規則來源調整統計計數."""
+        self._stats["total_rules"] += delta
+        key = _SOURCE_STAT_KEYS.get(rule.get("source_type", ""))
+        if key:
+            self._stats[key] += delta
     
     # ═══════════════════════════════════════════════════════════════
     # Learned Rules CRUD
@@ -153,20 +314,19 @@ class LearnedRulesService:
         Returns:
             是否成功新增（若關鍵字已存在則返回 False）
         """
-        learned = self._data.setdefault("learned_rules", [])
+        self._ensure_loaded()
         
         # 檢查是否已存在相同 keyword + code 的規則
-        for existing in learned:
-            if existing["keyword"] == rule.keyword and existing["code"] == rule.code:
-                # 更新 hit_count
-                existing["hit_count"] = existing.get("hit_count", 0) + 1
-                self._save()
-                return False
+        key = (rule.keyword, rule.code)
+        existing = self._learned_idx.get(key)
+        if existing is not None:
+            self._bump_hit_count(existing)
+            return False
         
         # 新增規則
-        learned.append({
-            "keyword": rule.keyword,
-            "code": rule.code,
+        entry = {
+            "keyword": intern(rule.keyword),
+            "code": intern(rule.code),
             "confidence": rule.confidence,
             "reason": rule.reason,
             "source_type": rule.source_type,
@@ -174,14 +334,34 @@ class LearnedRulesService:
             "confirmed_by": rule.confirmed_by,
             "confirmed_at": rule.confirmed_at.isoformat(),
             "hit_count": rule.hit_count,
-        })
+        }
+        self._learned.append(entry)
+        self._learned_idx[key] = entry
+        self._count_learned(entry, 1)
         
-        self._save()
+        self._mark_dirty()
         return True
     
+    def _bump_hit_count(self, entry: dict[str, Any]) -> None:
+        """更新已存在規則的 hit_count，累積到一定次數才寫入."""
+        entry["hit_count"] = entry.get("hit_count", 0) + 1
+        self._hit_dirty_count += 1
+        if self._hit_dirty_count >= self.HIT_FLUSH_EVERY:
+            self._mark_dirty()
+        else:
+            self._dirty = True
+
+    def _classify_status(self, keyword: str, code: str) -> str:
+        """判斷關鍵字+代碼的狀態：rejected | existing | new."""
+        key = (keyword, code)
+        if key in self._rejected_idx:
+            return "rejected"
+        return "existing" if key in self._learned_idx else "new"
+
     def get_learned_rules(self) -> list[dict[str, Any]]:
         """取得所有已學習的規則."""
-        return self._data.get("learned_rules", [])
+        self._ensure_loaded()
+        return self._learned
     
     def remove_learned_rule(self, keyword: str, code: str) -> bool:
         """
@@ -194,18 +374,19 @@ class LearnedRulesService:
         Returns:
             是否成功移除
         """
-        learned = self._data.get("learned_rules", [])
-        original_len = len(learned)
-        
-        self._data["learned_rules"] = [
-            r for r in learned
-            if not (r["keyword"] == keyword and r["code"] == code)
-        ]
+        self._ensure_loaded()
+        if self._learned_idx.pop((keyword, code), None) is None:
+            return False
         
-        if len(self._data["learned_rules"]) < original_len:
-            self._save()
-            return True
-        return False
+        kept = []
+        for r in self._learned:
+            if r["keyword"] == keyword and r["code"] == code:
+                self._count_learned(r, -1)
+            else:
+                kept.append(r)
+        self._learned[:] = kept
+        self._mark_dirty()
+        return True
     
     # ═══════════════════════════════════════════════════════════════
     # Pending Rules CRUD
@@ -213,33 +394,35 @@ class LearnedRulesService:
     
     def add_pending_rule(self, rule: PendingRule) -> bool:
         """新增待審核規則."""
-        pending = self._data.setdefault("pending_rules", [])
+        self._ensure_loaded()
         
         # 檢查是否已在 pending 或 rejected
-        for existing in pending:
-            if existing["keyword"] == rule.keyword and existing["code"] == rule.code:
-                return False
+        key = (rule.keyword, rule.code)
+        if key in self._pending_idx:
+            return False
         
-        for rejected in self._data.get("rejected_rules", []):
-            if rejected["keyword"] == rule.keyword and rejected["code"] == rule.code:
-                return False  # 已被拒絕過，不再建議
+        if key in self._rejected_idx:
+            return False  # 已被拒絕過，不再建議
         
-        pending.append({
-            "keyword": rule.keyword,
-            "code": rule.code,
+        entry = {
+            "keyword": intern(rule.keyword),
+            "code": intern(rule.code),
             "confidence": rule.confidence,
             "reason": rule.reason,
             "source_session": rule.source_session,
             "suggested_at": rule.suggested_at.isoformat(),
             "status": rule.status,
-        })
+        }
+        self._pending.append(entry)
+        self._pending_idx[key] = entry
         
-        self._save()
+        self._mark_dirty()
         return True
     
     def get_pending_rules(self) -> list[dict[str, Any]]:
         """取得所有待審核的規則."""
-        return self._data.get("pending_rules", [])
+        self._ensure_loaded()
+        return self._pending
     
     def approve_pending_rule(
         self,
@@ -258,28 +441,30 @@ class LearnedRulesService:
         Returns:
             是否成功核准
         """
-        pending = self._data.get("pending_rules", [])
+        self._ensure_loaded()
+        rule = self._pending_idx.get((keyword, code))
+        if rule is None:
+            return False
         
-        for i, rule in enumerate(pending):
-            if rule["keyword"] == keyword and rule["code"] == code:
-                # 轉移到 learned_rules
-                learned_rule = LearnedRule(
-                    keyword=rule["keyword"],
-                    code=rule["code"],
-                    confidence=rule["confidence"],
-                    reason=rule["reason"],
-                    source_type="agent",
-                    source_session=rule.get("source_session"),
-                    confirmed_by=confirmed_by,
-                )
-                self.add_learned_rule(learned_rule)
-                
-                # 從 pending 移除
-                pending.pop(i)
-                self._save()
-                return True
-        
-        return False
+        now = datetime.now(timezone.utc)
+        with self.batch():
+            # 轉移到 learned_rules
+            learned_rule = LearnedRule(
+                keyword=rule["keyword"],
+                code=rule["code"],
+                confidence=rule["confidence"],
+                reason=rule["reason"],
+                source_type="agent",
+                source_session=rule.get("source_session"),
+                confirmed_by=confirmed_by,
+                confirmed_at=now,
+            )
+            self.add_learned_rule(learned_rule)
+
+            # 從 pending 移除
+            self._remove_pending(rule)
+            self._mark_dirty(now.isoformat())
+        return True
     
     def reject_pending_rule(
         self,
@@ -300,26 +485,41 @@ class LearnedRulesService:
         Returns:
             是否成功拒絕
         """
-        pending = self._data.get("pending_rules", [])
+        self._ensure_loaded()
+        rule = self._pending_idx.get((keyword, code))
+        if rule is None:
+            return False
         
-        for i, rule in enumerate(pending):
-            if rule["keyword"] == keyword and rule["code"] == code:
-                # 轉移到 rejected_rules
-                rejected = self._data.setdefault("rejected_rules", [])
-                rejected.append({
-                    "keyword": rule["keyword"],
-                    "code": rule["code"],
-                    "rejected_reason": reason,
-                    "rejected_by": rejected_by,
-                    "rejected_at": datetime.now(timezone.utc).isoformat(),
-                })
-                
-                # 從 pending 移除
-                pending.pop(i)
-                self._save()
-                return True
+        # 轉移到 rejected_rules
+        now = datetime.now(timezone.utc).isoformat()
+        entry = {
+            "keyword": rule["keyword"],
+            "code": rule["code"],
+            "rejected_reason": reason,
+            "rejected_by": rejected_by,
+            "rejected_at": now,
+        }
+        self._rejected.append(entry)
+        self._rejected_idx.setdefault((keyword, code), entry)
         
-        return False
+        # 從 pending 移除
+        self._remove_pending(rule)
+        self._mark_dirty(now)
+        return True
+
+    def _remove_pending(self, rule: dict[str, Any]) -> None:
+        """從 pending 移除指定規則，並讓索引指向下一筆相同的規則."""
+        pending = self._pending
+        for i, existing in enumerate(pending):
+            if existing is rule:
+                del pending[i]
+                break
+        key = (rule["keyword"], rule["code"])
+        del self._pending_idx[key]
+        for existing in pending:
+            if (existing["keyword"], existing["code"]) == key:
+                self._pending_idx[key] = existing
+                break
     
     # ═══════════════════════════════════════════════════════════════
     # Utility Methods
@@ -327,18 +527,17 @@ class LearnedRulesService:
     
     def is_keyword_rejected(self, keyword: str, code: str) -> bool:
         """檢查關鍵字+代碼是否曾被拒絕."""
-        rejected = self._data.get("rejected_rules", [])
-        return any(
-            r["keyword"] == keyword and r["code"] == code
-            for r in rejected
-        )
+        self._ensure_loaded()
+        return (keyword, code) in self._rejected_idx
     
     def get_stats(self) -> dict[str, int]:
-        """取得統計資訊."""
-        return self._data.get("metadata", {}).get("stats", {})
+        """取得統計資訊（含尚未寫入檔案的變更）."""
+        self._ensure_loaded()
+        return dict(self._stats)
     
     def reload(self) -> None:
-        """重新載入規則檔案."""
+        """重新載入規則檔案（先寫入尚未存檔的變更）."""
+        self.flush()
         self._load()
     
     def confirm_classification(
@@ -367,25 +566,34 @@ class LearnedRulesService:
         # 提取關鍵字（簡單策略：使用整個描述或前 20 字）
         keyword = description[:50] if len(description) > 50 else description
         
+        self._ensure_loaded()
+        status = self._classify_status(keyword, hfacs_code)
+
         # 檢查是否已被拒絕
-        if self.is_keyword_rejected(keyword, hfacs_code):
+        if status == "rejected":
             return {
                 "success": False,
                 "message": f"此分類組合 ({keyword} → {hfacs_code}) 曾被拒絕",
                 "action": "skipped",
             }
         
-        # 新增學習規則
-        rule = LearnedRule(
-            keyword=keyword,
-            code=hfacs_code,
-            confidence=confidence,
-            reason=reason,
-            source_type="agent",
-            source_session=session_id,
-        )
-        
-        is_new = self.add_learned_rule(rule)
+        is_new = status == "new"
+        if is_new:
+            # 新增學習規則
+            now = datetime.now(timezone.utc)
+            with self.batch():
+                self.add_learned_rule(LearnedRule(
+                    keyword=keyword,
+                    code=hfacs_code,
+                    confidence=confidence,
+                    reason=reason,
+                    source_type="agent",
+                    source_session=session_id,
+                    confirmed_at=now,
+                ))
+                self._mark_dirty(now.isoformat())
+        else:
+            self._bump_hit_count(self._learned_idx[(keyword, hfacs_code)])
         
         return {
             "success": True,
@@ -29,30 +29,32 @@ class Stage(str, Enum):
 
     def next(self) -> "Stage | None":
         """Return the next stage, or None if this is the last."""
-        stages = list(Stage)
-        idx = stages.index(self)
-        if idx + 1 < len(stages):
-            return stages[idx + 1]
-        return None
+        return _STAGE_NEXT[self]
 
     def previous(self) -> "Stage | None":
         """Return the previous stage, or None if this is the first."""
-        stages = list(Stage)
-        idx = stages.index(self)
-        if idx > 0:
-            return stages[idx - 1]
-        return None
+        return _STAGE_PREV[self]
 
     def can_transition_to(self, target: "Stage") -> bool:
         """Check if transition to target stage is allowed."""
-        stages = list(Stage)
-        current_idx = stages.index(self)
-        target_idx = stages.index(target)
+        current_idx = _STAGE_INDEX[self]
+        target_idx = _STAGE_INDEX[target]
 
         # Can only move forward by one step, or backward (rollback)
         return target_idx == current_idx + 1 or target_idx < current_idx
 
 
+# Stage order and neighbours, precomputed for the Stage methods above
+_STAGE_ORDER: tuple[Stage, ...] = tuple(Stage)
+_STAGE_INDEX: dict[Stage, int] = {stage: i for i, stage in enumerate(_STAGE_ORDER)}
+_STAGE_NEXT: dict[Stage, Stage | None] = dict(
+    zip(_STAGE_ORDER, (*_STAGE_ORDER[1:], None), strict=True)
+)
+_STAGE_PREV: dict[Stage, Stage | None] = dict(
+    zip(_STAGE_ORDER, (None, *_STAGE_ORDER[:-1]), strict=True)
+)
+
+
 class CaseType(str, Enum):
     """RCA Case Types."""
 
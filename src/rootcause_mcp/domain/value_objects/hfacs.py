@@ -9,7 +9,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Self
 
 
 class HFACSLevel(str, Enum):
@@ -50,15 +49,23 @@ class HFACSCode:
             raise ValueError(f"Invalid HFACS code format: {self.code}")
 
     @classmethod
-    def from_code(cls, code: str) -> Self:
+    def from_code(cls, code: str) -> HFACSCode:
         """
         Create HFACSCode from code string.
 
         Looks up the code in the standard HFACS-MES code table.
+        Instances are immutable, so every code is built once and shared.
         """
-        code_info = HFACS_CODE_TABLE.get(code)
-        if not code_info:
-            raise ValueError(f"Unknown HFACS code: {code}")
+        try:
+            return _HFACS_CODES[code]
+        except KeyError:
+            raise ValueError(f"Unknown HFACS code: {code}") from None
+
+    @classmethod
+    def _from_table_entry(
+        cls, code: str, code_info: dict[str, HFACSLevel | str]
+    ) -> HFACSCode:
+        """Build an HFACSCode from an HFACS_CODE_TABLE entry."""
         level = code_info["level"]
         if not isinstance(level, HFACSLevel):
             raise TypeError(f"Invalid level type for code {code}")
@@ -286,19 +293,27 @@ HFACS_CODE_TABLE: dict[str, dict[str, HFACSLevel | str]] = {
     },
 }
 
+# Prebuilt HFACSCode for every table entry, in table order
+_HFACS_CODES: dict[str, HFACSCode] = {
+    code: HFACSCode._from_table_entry(code, info)
+    for code, info in HFACS_CODE_TABLE.items()
+}
+
+# Prebuilt codes per level, in table order
+_CODES_BY_LEVEL: dict[HFACSLevel, tuple[HFACSCode, ...]] = {
+    level: tuple(hc for hc in _HFACS_CODES.values() if hc.level is level)
+    for level in HFACSLevel
+}
+
 
 def get_all_hfacs_codes() -> list[HFACSCode]:
     """Get all HFACS-MES codes."""
-    return [HFACSCode.from_code(code) for code in HFACS_CODE_TABLE]
+    return list(_HFACS_CODES.values())
 
 
 def get_codes_by_level(level: HFACSLevel) -> list[HFACSCode]:
     """Get all HFACS codes for a specific level."""
-    return [
-        HFACSCode.from_code(code)
-        for code, info in HFACS_CODE_TABLE.items()
-        if info["level"] == level
-    ]
+    return list(_CODES_BY_LEVEL.get(level, ()))
 
 
 def is_valid_hfacs_code(code: str) -> bool:
@@ -6,11 +6,18 @@ Strong typing for domain identifiers to prevent mixing up IDs.
 
 from __future__ import annotations
 
-import uuid
 from dataclasses import dataclass
+from secrets import token_hex
 from typing import Self
 
 
+def _unchecked[IdT](cls: type[IdT], value: str) -> IdT:
+    """Build an identifier whose value is known to be valid, skipping validation."""
+    ident = object.__new__(cls)
+    object.__setattr__(ident, "value", value)
+    return ident
+
+
 @dataclass(frozen=True, slots=True)
 class SessionId:
     """Strongly-typed Session identifier."""
@@ -18,16 +25,16 @@ class SessionId:
     value: str
 
     def __post_init__(self) -> None:
-        if not self.value:
-            raise ValueError("SessionId cannot be empty")
-        if not self.value.startswith("rc_sess_"):
-            raise ValueError(f"SessionId must start with 'rc_sess_', got: {self.value}")
+        value = self.value
+        if not value.startswith("rc_sess_"):
+            if not value:
+                raise ValueError("SessionId cannot be empty")
+            raise ValueError(f"SessionId must start with 'rc_sess_', got: {value}")
 
     @classmethod
     def generate(cls) -> Self:
         """Generate a new unique SessionId."""
-        unique_part = uuid.uuid4().hex[:8]
-        return cls(f"rc_sess_{unique_part}")
+        return _unchecked(cls, f"rc_sess_{token_hex(4)}")
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -45,16 +52,16 @@ class CauseId:
     value: str
 
     def __post_init__(self) -> None:
-        if not self.value:
-            raise ValueError("CauseId cannot be empty")
-        if not self.value.startswith("c_"):
-            raise ValueError(f"CauseId must start with 'c_', got: {self.value}")
+        value = self.value
+        if not value.startswith("c_"):
+            if not value:
+                raise ValueError("CauseId cannot be empty")
+            raise ValueError(f"CauseId must start with 'c_', got: {value}")
 
     @classmethod
     def generate(cls) -> Self:
         """Generate a new unique CauseId."""
-        unique_part = uuid.uuid4().hex[:8]
-        return cls(f"c_{unique_part}")
+        return _unchecked(cls, f"c_{token_hex(4)}")
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -72,16 +79,16 @@ class FishboneId:
     value: str
 
     def __post_init__(self) -> None:
-        if not self.value:
-            raise ValueError("FishboneId cannot be empty")
-        if not self.value.startswith("fb_"):
-            raise ValueError(f"FishboneId must start with 'fb_', got: {self.value}")
+        value = self.value
+        if not value.startswith("fb_"):
+            if not value:
+                raise ValueError("FishboneId cannot be empty")
+            raise ValueError(f"FishboneId must start with 'fb_', got: {value}")
 
     @classmethod
     def generate(cls) -> Self:
         """Generate a new unique FishboneId."""
-        unique_part = uuid.uuid4().hex[:8]
-        return cls(f"fb_{unique_part}")
+        return _unchecked(cls, f"fb_{token_hex(4)}")
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -99,16 +106,16 @@ class ActionId:
     value: str
 
     def __post_init__(self) -> None:
-        if not self.value:
-            raise ValueError("ActionId cannot be empty")
-        if not self.value.startswith("act_"):
-            raise ValueError(f"ActionId must start with 'act_', got: {self.value}")
+        value = self.value
+        if not value.startswith("act_"):
+            if not value:
+                raise ValueError("ActionId cannot be empty")
+            raise ValueError(f"ActionId must start with 'act_', got: {value}")
 
     @classmethod
     def generate(cls) -> Self:
         """Generate a new unique ActionId."""
-        unique_part = uuid.uuid4().hex[:8]
-        return cls(f"act_{unique_part}")
+        return _unchecked(cls, f"act_{token_hex(4)}")
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -7,19 +7,22 @@ Implements CauseRepository using SQLModel.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from sqlmodel import Session as DBSession, select
 
 from rootcause_mcp.domain.entities.cause import Cause
-from rootcause_mcp.domain.repositories.cause_repository import CauseRepository
 from rootcause_mcp.domain.value_objects.identifiers import CauseId, SessionId
 from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
 from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 from rootcause_mcp.infrastructure.persistence.models import CauseModel
 from rootcause_mcp.infrastructure.persistence.database import Database
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-class SQLiteCauseRepository(CauseRepository):
+
+class SQLiteCauseRepository:
     """
     SQLite implementation of CauseRepository.
 
@@ -50,6 +53,12 @@ class SQLiteCauseRepository(CauseRepository):
 
             db_session.commit()
 
+    def save_many(self, causes: Iterable[Cause]) -> None:
+        """Save several causes (create or update) in one transaction."""
+        self._db.upsert_many(
+            CauseModel, [self._to_model(cause).model_dump() for cause in causes]
+        )
+
     def get(self, cause_id: CauseId) -> Cause | None:
         """Get a cause by ID."""
         return self.get_by_id(str(cause_id))
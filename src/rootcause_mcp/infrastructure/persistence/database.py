@@ -6,14 +6,27 @@ SQLite database setup using SQLModel.
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, Session, create_engine
 
 if TYPE_CHECKING:
     from sqlalchemy import Engine
 
+# Applied to every new SQLite connection
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA foreign_keys=ON",
+)
+
 
 class Database:
     """
@@ -46,11 +59,27 @@ class Database:
     def engine(self) -> "Engine":
         """Get or create the database engine."""
         if self._engine is None:
+            in_memory = self.db_url.endswith(":memory:")
             self._engine = create_engine(
                 self.db_url,
                 echo=False,  # Set to True for SQL debugging
                 connect_args={"check_same_thread": False},  # Required for SQLite
+                # In-memory databases live in one connection; share it
+                poolclass=StaticPool if in_memory else None,
+            )
+            # WAL lets readers run alongside a writer; not available in memory
+            pragmas = _SQLITE_PRAGMAS if in_memory else (
+                "PRAGMA journal_mode=WAL",
+                *_SQLITE_PRAGMAS,
             )
+
+            @event.listens_for(self._engine, "connect")
+            def _set_pragmas(dbapi_connection: Any, _record: Any) -> None:
+                cursor = dbapi_connection.cursor()
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+                cursor.close()
+
         return self._engine
 
     def create_tables(self) -> None:
@@ -76,6 +105,36 @@ class Database:
         """
         return Session(self.engine)
 
+    def upsert_many(
+        self, model: type[SQLModel], rows: list[dict[str, Any]]
+    ) -> None:
+        """
+        Insert rows, updating those whose id already exists, in one transaction.
+
+        Conflicting rows have every non-key column overwritten and
+        updated_at set to now, matching the repositories' save().
+
+        Args:
+            model: Table model the rows belong to
+            rows: Column values per row (e.g. from model_dump())
+        """
+        if not rows:
+            return
+
+        # INSERT ... ON CONFLICT DO UPDATE, executed once for all rows
+        stmt = sqlite_insert(model)
+        columns: dict[str, Any] = {
+            column.name: stmt.excluded[column.name]
+            for column in model.__table__.columns  # type: ignore[attr-defined]
+            if not column.primary_key
+        }
+        columns["updated_at"] = datetime.now(UTC)
+        stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=columns)
+
+        with self.get_session() as session:
+            session.exec(stmt, params=rows)
+            session.commit()
+
     def close(self) -> None:
         """Close the database connection."""
         if self._engine:
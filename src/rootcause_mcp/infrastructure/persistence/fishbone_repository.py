@@ -7,7 +7,7 @@ Implements FishboneRepository using SQLModel.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sqlmodel import Session as DBSession, select
 
@@ -16,7 +16,6 @@ from rootcause_mcp.domain.entities.fishbone import (
     FishboneCategory,
     FishboneCause,
 )
-from rootcause_mcp.domain.repositories.fishbone_repository import FishboneRepository
 from rootcause_mcp.domain.value_objects.identifiers import (
     FishboneId,
     SessionId,
@@ -27,8 +26,11 @@ from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 from rootcause_mcp.infrastructure.persistence.models import FishboneModel
 from rootcause_mcp.infrastructure.persistence.database import Database
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-class SQLiteFishboneRepository(FishboneRepository):
+
+class SQLiteFishboneRepository:
     """
     SQLite implementation of FishboneRepository.
 
@@ -59,6 +61,13 @@ class SQLiteFishboneRepository(FishboneRepository):
 
             db_session.commit()
 
+    def save_many(self, fishbones: Iterable[Fishbone]) -> None:
+        """Save several fishbone diagrams (create or update) in one transaction."""
+        self._db.upsert_many(
+            FishboneModel,
+            [self._to_model(fishbone).model_dump() for fishbone in fishbones],
+        )
+
     def get(self, fishbone_id: FishboneId) -> Fishbone | None:
         """Get a fishbone by ID."""
         with self._db.get_session() as db_session:
@@ -12,7 +12,6 @@ from typing import Any
 from sqlmodel import Session as DBSession, select
 
 from rootcause_mcp.domain.entities.session import RCASession, StageRecord
-from rootcause_mcp.domain.repositories.session_repository import SessionRepository
 from rootcause_mcp.domain.value_objects.identifiers import SessionId
 from rootcause_mcp.domain.value_objects.enums import (
     CaseType,
@@ -23,8 +22,16 @@ from rootcause_mcp.domain.value_objects.enums import (
 from rootcause_mcp.infrastructure.persistence.models import SessionModel
 from rootcause_mcp.infrastructure.persistence.database import Database
 
+# Enum decoding tables for rows read back from the database; unknown values
+# still go through the enum constructor so they raise ValueError as before
+_STAGES: tuple[Stage, ...] = tuple(Stage)
+_STAGE_STATUS_BY_VALUE: dict[str, StageStatus] = {s.value: s for s in StageStatus}
+_STAGE_BY_VALUE: dict[str, Stage] = {s.value: s for s in Stage}
+_CASE_TYPE_BY_VALUE: dict[str, CaseType] = {c.value: c for c in CaseType}
+_SESSION_STATUS_BY_VALUE: dict[str, SessionStatus] = {s.value: s for s in SessionStatus}
 
-class SQLiteSessionRepository(SessionRepository):
+
+class SQLiteSessionRepository:
     """
     SQLite implementation of SessionRepository.
 
@@ -160,13 +167,16 @@ class SQLiteSessionRepository(SessionRepository):
         """Convert database model to domain entity."""
         # Deserialize stage records
         stage_records: dict[Stage, StageRecord] = {}
-        for stage in Stage:
+        for stage in _STAGES:
             stage_value = stage.value
             if stage_value in model.stage_data:
                 data = model.stage_data[stage_value]
                 record = StageRecord(
                     stage=stage,
-                    status=StageStatus(data["status"]),
+                    status=(
+                        _STAGE_STATUS_BY_VALUE.get(data["status"])
+                        or StageStatus(data["status"])
+                    ),
                     data=data.get("data", {}),
                     validation_errors=data.get("validation_errors", []),
                     validation_warnings=data.get("validation_warnings", []),
@@ -181,10 +191,17 @@ class SQLiteSessionRepository(SessionRepository):
 
         return RCASession(
             id=SessionId.from_string(model.id),
-            case_type=CaseType(model.case_type),
+            case_type=(
+                _CASE_TYPE_BY_VALUE.get(model.case_type) or CaseType(model.case_type)
+            ),
             case_title=model.case_title,
-            current_stage=Stage(model.current_stage),
-            status=SessionStatus(model.status),
+            current_stage=(
+                _STAGE_BY_VALUE.get(model.current_stage) or Stage(model.current_stage)
+            ),
+            status=(
+                _SESSION_STATUS_BY_VALUE.get(model.status)
+                or SessionStatus(model.status)
+            ),
             problem_statement=model.problem_statement,
             initial_description=model.initial_description,
             stage_records=stage_records,
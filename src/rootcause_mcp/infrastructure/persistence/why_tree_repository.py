@@ -9,7 +9,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from rootcause_mcp.domain.entities.why_node import WhyChain, WhyNode
-from rootcause_mcp.domain.repositories.why_tree_repository import WhyTreeRepository
 from rootcause_mcp.domain.value_objects.identifiers import CauseId, SessionId
 from rootcause_mcp.domain.value_objects.scores import ConfidenceScore
 
@@ -17,7 +16,7 @@ if TYPE_CHECKING:
     from rootcause_mcp.infrastructure.persistence.database import Database
 
 
-class InMemoryWhyTreeRepository(WhyTreeRepository):
+class InMemoryWhyTreeRepository:
     """
     In-memory implementation of WhyTreeRepository.
 
@@ -69,10 +68,7 @@ class InMemoryWhyTreeRepository(WhyTreeRepository):
         # Also update in chain
         chain = self._chains.get(str(node.session_id))
         if chain:
-            for i, existing in enumerate(chain.nodes):
-                if str(existing.id) == str(node.id):
-                    chain.nodes[i] = node
-                    break
+            chain.replace_node(node)
 
     def delete_chain(self, session_id: SessionId) -> bool:
         """Delete a WhyChain and all its nodes."""
@@ -8,6 +8,7 @@ Delegates to modular handlers organized by domain.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -113,6 +114,8 @@ def _initialize_services() -> None:
     # Initialize Domain Services
     hfacs_suggester = HFACSSuggester(config_dir=hfacs_config_path)
     learned_rules = LearnedRulesService(config_dir=hfacs_config_path)
+    # Deferred hit-count updates are written on exit
+    atexit.register(learned_rules.flush)
     
     # Initialize Database and Repositories
     db_path = data_path / "rca_sessions.db"
@@ -0,0 +1,58 @@
+"""Tests for the Fishbone entity."""
+
+from __future__ import annotations
+
+from rootcause_mcp.domain.entities.fishbone import Fishbone, FishboneCause
+from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
+from rootcause_mcp.domain.value_objects.identifiers import CauseId, SessionId
+
+
+def _cause(
+    category: FishboneCategoryType = FishboneCategoryType.PERSONNEL,
+) -> FishboneCause:
+    return FishboneCause(CauseId.generate(), category, "交班不完整")
+
+
+def test_category_mutations_refresh_aggregates() -> None:
+    """Adding/removing causes on a category keeps the diagram's queries current."""
+    fishbone = Fishbone.create(SessionId.generate(), "給錯藥")
+    assert fishbone.total_cause_count == 0
+    assert fishbone.coverage_ratio == 0.0
+
+    cause = _cause()
+    category = fishbone.get_category(FishboneCategoryType.PERSONNEL)
+    category.add_cause(cause)
+    assert fishbone.total_cause_count == 1
+    assert fishbone.coverage_ratio == 1 / 6
+    assert fishbone.get_all_causes() == [cause]
+
+    category.remove_cause(cause.cause_id)
+    assert fishbone.total_cause_count == 0
+    assert fishbone.populated_categories == []
+
+
+def test_hfacs_level_query_sees_direct_code_changes() -> None:
+    """Assigning cause.hfacs_code directly is reflected by the HFACS query."""
+    fishbone = Fishbone.create(SessionId.generate(), "給錯藥")
+    cause = _cause()
+    fishbone.add_cause_to_category(cause.category, cause)
+    assert fishbone.get_causes_by_hfacs_level("UA") == []
+
+    cause.hfacs_code = "UA-SBE"
+    assert fishbone.get_causes_by_hfacs_level("UA") == [cause]
+    assert fishbone.get_causes_by_hfacs_level("UA-S") == [cause]
+    assert fishbone.get_causes_by_hfacs_level("PC") == []
+
+
+def test_exports_are_fresh() -> None:
+    """to_dict() reflects direct cause edits and is not shared."""
+    fishbone = Fishbone.create(SessionId.generate(), "給錯藥")
+    cause = _cause()
+    fishbone.add_cause_to_category(cause.category, cause)
+
+    exported = fishbone.to_dict()
+    exported["problem_statement"] = "MUT"
+    assert fishbone.to_dict()["problem_statement"] == "給錯藥"
+
+    cause.description = "交班資訊遺漏"
+    assert "交班資訊遺漏" in str(fishbone.to_dict()["categories"])
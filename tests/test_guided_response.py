@@ -0,0 +1,109 @@
+"""Tests for guided response generation."""
+
+from __future__ import annotations
+
+from rootcause_mcp.application.guided_response import (
+    GuidedResponseBuilder,
+    format_guided_response,
+)
+from rootcause_mcp.application.session_progress import SessionProgress
+
+
+def test_next_action_follows_stage() -> None:
+    """Each analysis stage maps to its recommended tool."""
+    builder = GuidedResponseBuilder()
+    cases = [
+        (SessionProgress(session_id="s"), "INIT", "rc_start_session"),
+        (
+            SessionProgress(
+                session_id="s",
+                fishbone_initialized=True,
+                fishbone_categories_filled=3,
+            ),
+            "GATHER_LATE",
+            "rc_add_cause",
+        ),
+        (
+            SessionProgress(
+                session_id="s",
+                fishbone_initialized=True,
+                fishbone_categories_filled=4,
+                why_tree_started=True,
+                why_tree_depth=3,
+                root_causes_identified=1,
+            ),
+            "VERIFY",
+            "rc_verify_causation",
+        ),
+    ]
+
+    for progress, stage, tool in cases:
+        response = builder.build({}, progress, "rc_test")
+        assert response.session_progress["current_stage"] == stage
+        assert response.next_action.tool == tool
+
+
+def test_next_action_hint_is_formatted() -> None:
+    """Hints that depend on progress values are filled in."""
+    progress = SessionProgress(
+        session_id="s",
+        fishbone_initialized=True,
+        fishbone_categories_filled=5,
+        why_tree_started=True,
+        why_tree_depth=2,
+    )
+
+    action = GuidedResponseBuilder().build({}, progress, "rc_ask_why").next_action
+
+    assert action.hint == "目前 Why 深度為 2，建議追問到至少 3 層"
+
+
+def test_format_guided_response_appends_guidance() -> None:
+    """Formatted text keeps the original result and adds the next step."""
+    progress = SessionProgress(session_id="s", fishbone_initialized=True)
+
+    text = format_guided_response("原始結果", progress, "rc_init_fishbone")
+
+    assert text.startswith("原始結果\n")
+    assert "[░░░░░░░░░░] 0%" in text
+    assert "**工具:** `rc_add_cause`" in text
+
+
+def test_progress_dicts_refresh_after_progress_changes() -> None:
+    """Cached progress/state dicts are rebuilt only when progress changes."""
+    builder = GuidedResponseBuilder()
+    progress = SessionProgress(session_id="s", fishbone_initialized=True)
+
+    first = builder.build({}, progress, "rc_add_cause")
+    version = progress.version
+    progress.fishbone_initialized = True
+    assert progress.version == version
+
+    first.to_dict()["session_progress"]["current_stage"] = "HACK"
+    first.current_state["fishbone"]["initialized"] = False
+    again = builder.build({}, progress, "rc_get_fishbone")
+    assert again.session_progress["current_stage"] == "GATHER_EARLY"
+    assert again.current_state["fishbone"]["initialized"] is True
+
+    progress.fishbone_categories_filled = 2
+    updated = builder.build({}, progress, "rc_add_cause")
+    assert updated.current_state["fishbone"]["categories_filled"] == "2/6"
+
+
+def test_build_and_format_matches_separate_calls() -> None:
+    """The fused entry point agrees with build() and format_guided_response()."""
+    builder = GuidedResponseBuilder()
+    progress = SessionProgress(
+        session_id="s",
+        fishbone_initialized=True,
+        fishbone_categories_filled=4,
+        why_tree_started=True,
+        why_tree_depth=3,
+        root_causes_identified=1,
+        root_causes_verified=1,
+    )
+
+    response, text = builder.build_and_format({}, "結果", progress, "rc_test")
+
+    assert response.to_dict() == builder.build({}, progress, "rc_test").to_dict()
+    assert text == format_guided_response("結果", progress, "rc_test")
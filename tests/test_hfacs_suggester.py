@@ -54,6 +54,20 @@ def test_guiding_questions():
             print(f"  - {q}")
 
 
+def test_suggest_cache_returns_fresh_lists():
+    """Repeated descriptions reuse cached results until rules are reloaded."""
+    suggester = HFACSSuggester()
+    desc = "困難插管導致病人缺氧"
+
+    first = suggester.suggest(desc, max_suggestions=3)
+    again = suggester.suggest(desc, max_suggestions=3)
+    assert again == first
+    assert again is not first
+
+    suggester.reload_rules()
+    assert suggester.suggest(desc, max_suggestions=3) == first
+
+
 if __name__ == "__main__":
     test_suggester_loads_rules()
     test_suggester_suggests_anesthesia()
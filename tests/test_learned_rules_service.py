@@ -0,0 +1,69 @@
+"""Tests for LearnedRulesService."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rootcause_mcp.domain.services.learned_rules_service import (
+    LearnedRule,
+    LearnedRulesService,
+    PendingRule,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_batch_writes_once_on_exit(tmp_path: Path) -> None:
+    """Mutations inside batch() are saved together when the batch ends."""
+    service = LearnedRulesService(tmp_path)
+
+    with service.batch():
+        service.add_learned_rule(LearnedRule("插管困難", "UA-SBE", 0.8, "r"))
+        service.add_pending_rule(PendingRule("交班", "US-IS", 0.7, "p"))
+        service.approve_pending_rule("交班", "US-IS")
+        assert not service.rules_file.exists()
+        assert service.get_stats()["total_rules"] == 2
+
+    reloaded = LearnedRulesService(tmp_path)
+    assert [r["keyword"] for r in reloaded.get_learned_rules()] == ["插管困難", "交班"]
+    assert reloaded.get_pending_rules() == []
+    assert reloaded.get_stats()["total_rules"] == 2
+
+
+def test_hit_count_updates_are_deferred(tmp_path: Path) -> None:
+    """Re-adding a known rule only bumps hit_count on disk after flush()."""
+    service = LearnedRulesService(tmp_path)
+    rule = LearnedRule("插管困難", "UA-SBE", 0.8, "r")
+    service.add_learned_rule(rule)
+
+    assert service.add_learned_rule(rule) is False
+    assert LearnedRulesService(tmp_path).get_learned_rules()[0]["hit_count"] == 0
+
+    service.flush()
+    assert LearnedRulesService(tmp_path).get_learned_rules()[0]["hit_count"] == 1
+
+
+def test_unchanged_rules_are_not_rewritten(tmp_path: Path) -> None:
+    """A save whose rule content matches the last write leaves the file alone."""
+    service = LearnedRulesService(tmp_path)
+    service.add_learned_rule(LearnedRule("插管困難", "UA-SBE", 0.8, "r"))
+    before = service.rules_file.read_bytes()
+
+    with service.batch():
+        service.add_learned_rule(LearnedRule("交班", "US-IS", 0.7, "p"))
+        service.remove_learned_rule("交班", "US-IS")
+
+    assert service.rules_file.read_bytes() == before
+
+
+def test_bare_rule_keys_load_as_empty(tmp_path: Path) -> None:
+    """Keys left without a value (e.g. `learned_rules:`) read as empty lists."""
+    (tmp_path / "learned_rules.yaml").write_text(
+        "learned_rules:\npending_rules:\nrejected_rules:\n", encoding="utf-8"
+    )
+    service = LearnedRulesService(tmp_path)
+
+    assert service.get_learned_rules() == []
+    assert service.get_pending_rules() == []
+    assert service.is_keyword_rejected("插管困難", "UA-SBE") is False
@@ -0,0 +1,68 @@
+"""Tests for the SQLite repositories."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+from rootcause_mcp.domain.entities.cause import Cause
+from rootcause_mcp.domain.entities.fishbone import Fishbone
+from rootcause_mcp.domain.value_objects.enums import FishboneCategoryType
+from rootcause_mcp.domain.value_objects.identifiers import SessionId
+from rootcause_mcp.infrastructure.persistence import (
+    Database,
+    SQLiteCauseRepository,
+    SQLiteFishboneRepository,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _database() -> Database:
+    db = Database(":memory:")
+    db.create_tables()
+    return db
+
+
+def test_cause_save_many_inserts_and_updates() -> None:
+    """save_many() creates new causes and overwrites existing ones."""
+    repo = SQLiteCauseRepository(_database())
+    session_id = SessionId.generate()
+    existing = Cause.create(session_id, "交班不完整", FishboneCategoryType.PERSONNEL)
+    repo.save(existing)
+
+    existing.description = "交班資訊遺漏"
+    new = Cause.create(session_id, "警報疲勞", FishboneCategoryType.EQUIPMENT)
+    repo.save_many([existing, new])
+    repo.save_many([])
+
+    saved = {str(c.id): c for c in repo.list_by_session(session_id)}
+    assert set(saved) == {str(existing.id), str(new.id)}
+    assert saved[str(existing.id)].description == "交班資訊遺漏"
+    assert saved[str(new.id)].category is FishboneCategoryType.EQUIPMENT
+
+
+def test_fishbone_save_many() -> None:
+    """save_many() persists every fishbone in the batch."""
+    repo = SQLiteFishboneRepository(_database())
+    fishbones = [
+        Fishbone.create(SessionId.generate(), f"problem {i}") for i in range(3)
+    ]
+
+    repo.save_many(fishbones)
+
+    for fishbone in fishbones:
+        loaded = repo.get_by_session(fishbone.session_id)
+        assert loaded is not None
+        assert loaded.problem_statement == fishbone.problem_statement
+
+
+def test_file_database_uses_wal(tmp_path: Path) -> None:
+    """File-backed databases switch to WAL with relaxed fsync."""
+    db = Database(tmp_path / "rca.db")
+
+    with db.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL